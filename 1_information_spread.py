@@ -1,4 +1,6 @@
 from manim import *
+from intro import play_intro
+from background import BackgroundLayer
 
 class infSpread(Scene):
     def construct(self):    
@@ -20,6 +22,7 @@ class infSpread(Scene):
         
         first_person = create_person(RED, "Acong").to_edge(UP + LEFT, buff=0.5).scale(1.1)
         self.play(FadeIn(first_person), FadeIn(dGrid), run_time=1.25)
+        gridLayer = BackgroundLayer(self, dGrid).bake()
         self.wait(6)
         
         arrow = Arrow(start=LEFT, end=RIGHT, buff=0).next_to(first_person, RIGHT, buff=0.5)
@@ -124,58 +127,10 @@ class infSpread(Scene):
         self.wait(1)
 
         # === Part 2: Intro ===
+        gridLayer.release()
         self.play(FadeOut(branches_level1), FadeOut(branches_level2), FadeOut(branches_level3), FadeOut(branches_level4), FadeOut(john_copy), FadeOut(alice_copy), FadeOut(duke_copy), FadeOut(explanation), FadeOut(first_person), FadeOut(persons), FadeOut(arrow), FadeOut(dGrid), FadeOut(promotion))   
         self.wait(0.2)
         
-        main_text = MathTex(r"\ln \frac{dy}{dx}", font_size=120)
-        main_text.set_color_by_gradient(BLUE_B, GREEN_B)
-        
-        circles = VGroup()
-        for i in range(8):
-            circle = Circle(radius=0.5 + i * 0.3)
-            circle.set_stroke(BLUE, width=2, opacity=0.6 - i * 0.05)
-            circle.set_fill(opacity=0)
-            circles.add(circle)
-        
-        floating_symbols = VGroup()
-        symbols = [r"\int", r"\sum", r"\pi", r"e", r"\infty", r"\nabla"]
-        positions = [
-            UP * 2 + LEFT * 3,
-            UP * 1.5 + RIGHT * 4,
-            DOWN * 2 + LEFT * 4,
-            DOWN * 1.5 + RIGHT * 3,
-            UP * 3 + RIGHT * 2,
-            DOWN * 3 + LEFT * 2
-        ]
-        
-        for symbol, pos in zip(symbols, positions):
-            math_symbol = MathTex(symbol, font_size=60)
-            math_symbol.set_color(DARK_BLUE)
-            math_symbol.move_to(pos)
-            math_symbol.set_opacity(0.6)
-            floating_symbols.add(math_symbol)
-        
-        self.play(
-            LaggedStart(
-                *[FadeIn(symbol) for symbol in floating_symbols],
-                lag_ratio=0.2
-            ), LaggedStart(
-                *[Create(circle) for circle in circles],
-                lag_ratio=0.1
-            ),
-            run_time=0.8
-        )
-
-        self.play(
-            Write(main_text),
-            Rotate(circles, angle=2*PI, about_point=ORIGIN), 
-            run_time=1.3,
-            rate_func=linear
-        )
-        self.wait(0.8)
-        self.play(
-            FadeOut(circles), FadeOut(floating_symbols), FadeOut(main_text),
-            run_time=0.8
-        )
+        play_intro(self, symbol_lag_ratio=0.2, circle_lag_ratio=0.1, appear_run_time=0.8, write_run_time=1.3, fade_run_time=0.8)
                         
 # manim -pqh Manim/1_information_spread.py infSpread
\ No newline at end of file
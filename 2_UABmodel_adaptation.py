@@ -1,6 +1,10 @@
 from manim import *
+from background import BackgroundLayer
 import numpy as np
-import random
+from uab_engine import UABEngine, Trajectory, TrajectoryPlayer, simulation_steps, UNAWARE, AWARE, BORED
+from widgets import StatsPanel, DotCloud
+from scene_rng import scene_rng
+from scene_params import scene_param
 
 class UABModel(Scene):
     def construct(self):    
@@ -9,13 +13,18 @@ class UABModel(Scene):
             axis_config={"include_ticks": False, "stroke_opacity": 0}
         )
         self.play(FadeIn(dGrid))
+        BackgroundLayer(self, dGrid).bake()
         
         # === Part 3: information dissemination simulation ===
-        self.total_agents = 500
+        self.rng = scene_rng(self)
+        self.total_agents = scene_param("total_agents", 500)
         self.share_radius = 0.15  
         self.sharing_rate = 0.08  
         self.ignore_rate = 0.05   
         self.speed = 0.04         
+        self.contact_method = "grid"  # "brute" to validate the spatial index
+        # e.g. DY_MANIM_PARAMS='{"trajectory_file": "uab_trajectory.npz"}' plays back a run recorded by `python uab_engine.py`
+        self.trajectory_file = scene_param("trajectory_file", "")
 
         # Setup areas
         self.setup_areas()
@@ -36,35 +45,49 @@ class UABModel(Scene):
         self.play(FadeIn(self.sim_rect), FadeIn(self.chart_rect), FadeIn(sim_label), FadeIn(chart_label), run_time=0.4)
 
     def create_agents(self):
-        self.agents = []
-
         self.left_bound = -6.5
         self.right_bound = -1
         self.top_bound = 2
         self.bottom_bound = -2
 
-        for i in range(self.total_agents):
-            x = random.uniform(self.left_bound + 0.2, self.right_bound - 0.2)
-            y = random.uniform(self.bottom_bound + 0.2, self.top_bound - 0.2)
+        if self.trajectory_file:
+            self.load_trajectory()
+        else:
+            self.create_engine()
+        self.state_colors = {UNAWARE: GREEN, AWARE: RED, BORED: BLUE}
+
+        self.agents = DotCloud(np.zeros((self.total_agents, 2)), radius=0.04)
+        self.synced_states = np.full(self.total_agents, -1)
+        self.sync_agents()
+        self.add(self.agents)
+
+    def create_engine(self):
+        self.engine = UABEngine(
+            self.total_agents,
+            bounds=(self.left_bound, self.right_bound, self.bottom_bound, self.top_bound),
+            speed=self.speed,
+            share_radius=self.share_radius,
+            sharing_rate=self.sharing_rate,
+            ignore_rate=self.ignore_rate,
+            initial_aware=5,
+            contact_method=self.contact_method,
+            rng=self.rng
+        )
 
-            dot = Dot(radius=0.04).move_to([x, y, 0])
+    def load_trajectory(self):
+        # Playback mode: the agents follow a recorded run instead of being simulated
+        self.engine = TrajectoryPlayer(Trajectory.load(self.trajectory_file))
+        self.total_agents = self.engine.total_agents
 
-            if i < 5:  
-                dot.set_color(RED)
-                state = "aware"
-                info_time = 0
-            else:
-                dot.set_color(GREEN)
-                state = "unaware"
-                info_time = -1
+    def sync_agents(self):
+        # Push the engine arrays onto the dot cloud, recolouring only agents whose state changed
+        states = self.engine.states
+        self.agents.set_positions(self.engine.positions)
 
-            dot.state = state
-            dot.info_time = info_time
-            dot.vx = random.uniform(-self.speed, self.speed)
-            dot.vy = random.uniform(-self.speed, self.speed)
-
-            self.agents.append(dot)
-            self.add(dot)
+        changed = states != self.synced_states
+        for state, color in self.state_colors.items():
+            self.agents.set_dot_colors(changed & (states == state), color)
+        self.synced_states = states.copy()
 
     def setup_chart(self):
         self.axes = Axes(
@@ -87,63 +110,24 @@ class UABModel(Scene):
         ).arrange(DOWN, aligned_edge=LEFT, buff=0.2).next_to(self.chart_rect, DOWN, buff=0.3)
         self.add(legend)
 
-        self.stats = VGroup()
-        self.unaware_stat = Text("Unaware: 492", font_size=16, color=GREEN_A)
-        self.sharing_stat = Text("Aware: 8", font_size=16, color=RED_A)
-        self.informed_stat = Text("Bored: 0", font_size=16, color=BLUE_A)
+        # Curves are created once and only ever grow by one segment per sample
+        self.chart_lines = [VMobject().set_stroke(color, width=3) for color in [GREEN, RED, BLUE]]
 
-        self.stats.add(self.unaware_stat, self.sharing_stat, self.informed_stat)
-        self.stats.arrange(RIGHT, buff=0.5).next_to(self.sim_rect, DOWN, buff=0.3)
+        self.stats = StatsPanel(
+            {"unaware": ("Unaware", GREEN), "aware": ("Aware", RED), "bored": ("Bored", BLUE)},
+            max_value=self.total_agents,
+            font_size=16
+        ).next_to(self.sim_rect, DOWN, buff=0.3)
+        self.stats.set_counts(self.count_states())
         self.add(self.stats)
 
-    def update_agents(self):
-        for dot in self.agents:
-            pos = dot.get_center()
-            new_x = pos[0] + dot.vx
-            new_y = pos[1] + dot.vy
-
-            if new_x <= self.left_bound or new_x >= self.right_bound:
-                dot.vx *= -1
-                new_x = pos[0]
-            if new_y <= self.bottom_bound or new_y >= self.top_bound:
-                dot.vy *= -1
-                new_y = pos[1]
-
-            dot.move_to([new_x, new_y, 0])
-
-            if dot.state == "aware":
-                dot.info_time += 1
-                if dot.info_time > 40 and random.random() < self.ignore_rate:
-                    dot.state = "bored"
-                    dot.set_color(BLUE)
-
-        for i, dot1 in enumerate(self.agents):
-            if dot1.state == "aware":
-                for j, dot2 in enumerate(self.agents):
-                    if i != j and dot2.state == "unaware":
-                        d = np.linalg.norm(dot1.get_center() - dot2.get_center())
-                        if d < self.share_radius and random.random() < self.sharing_rate:
-                            dot2.state = "aware"
-                            dot2.set_color(RED)
-                            dot2.info_time = 0
-
     def count_states(self):
-        counts = {"unaware": 0, "aware": 0, "bored": 0}
-        for dot in self.agents:
-            counts[dot.state] += 1
-        return counts
+        return self.engine.counts()
 
     def update_chart(self):
         counts = self.count_states()
 
-        self.remove(self.stats)
-        self.unaware_stat = Text(f"Unaware: {counts['unaware']}", font_size=16, color=GREEN)
-        self.sharing_stat = Text(f"Aware: {counts['aware']}", font_size=16, color=RED)
-        self.informed_stat = Text(f"Bored: {counts['bored']}", font_size=16, color=BLUE)
-
-        self.stats = VGroup(self.unaware_stat, self.sharing_stat, self.informed_stat)
-        self.stats.arrange(RIGHT, buff=0.5).next_to(self.sim_rect, DOWN, buff=0.3)
-        self.add(self.stats)
+        self.stats.set_counts(counts)
 
         self.chart_data.append({
             'time': self.time_step,
@@ -152,38 +136,30 @@ class UABModel(Scene):
             'bored': counts['bored']
         })
 
-        if len(self.chart_data) > 1:
-            self.draw_chart_lines()
-
-    def draw_chart_lines(self):
-        if hasattr(self, 'chart_lines'):
-            for line in self.chart_lines:
-                self.remove(line)
-
-        self.chart_lines = []
-        times = [d['time'] for d in self.chart_data]
-        sets = [[d[k] for d in self.chart_data] for k in ['unaware', 'aware', 'bored']]
-        colors = [GREEN, RED, BLUE]
-
-        for data, color in zip(sets, colors):
-            if len(data) > 1:
-                points = [self.axes.coords_to_point(t, val) for t, val in zip(times, data)]
-                line = VMobject().set_points_as_corners(points).set_stroke(color, width=3)
-                self.add(line)
-                self.chart_lines.append(line)
+        self.extend_chart_lines()
+
+    def extend_chart_lines(self):
+        sample = self.chart_data[-1]
+        for line, key in zip(self.chart_lines, ['unaware', 'aware', 'bored']):
+            point = self.axes.coords_to_point(sample['time'], sample[key])
+            if len(self.chart_data) == 1:
+                line.start_new_path(point)
+            else:
+                line.add_line_to(point)
+
+        if len(self.chart_data) == 2:
+            self.add(*self.chart_lines)
     
     def run_simulation(self):
-        for step in range(1200):
+        if self.trajectory_file:
+            steps = self.engine.playback_steps()
+        else:
+            steps = simulation_steps(self.engine, steps=1200, step_every=3, min_steps=20)
+        for step in steps:
             self.time_step = step
-            
-            if step % 3 == 0:
-                self.update_agents()
-                self.update_chart()
-                self.wait(1/60) 
-            
-            counts = self.count_states()
-            if counts['aware'] == 0 and step > 20:
-                break
+            self.sync_agents()
+            self.update_chart()
+            self.wait(1/60) 
         self.wait(1)
         
 # manim -pqh Manim/2_UABmodel_adaptation.py UABModel
\ No newline at end of file
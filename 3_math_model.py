@@ -1,4 +1,5 @@
 from manim import *
+from background import BackgroundLayer
 import numpy as np
 
 class mathModel(Scene):
@@ -10,6 +11,7 @@ class mathModel(Scene):
 
         img = ImageMobject("Picture/UAB_Model_VisualizationEn.png").scale(0.16).shift(UP*2 + LEFT*6.6)
         self.play(FadeIn(dGrid), FadeIn(img))  
+        BackgroundLayer(self, dGrid).bake()
         self.wait(1.5)     
         
         # === Part 4: mathematical model and explanation === 
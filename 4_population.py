@@ -1,8 +1,12 @@
 from manim import *
-import random
+from intro import play_intro
+from background import BackgroundLayer
+from scene_rng import scene_rng
+from widgets import DotCloud, RevealDots
 
 class population(Scene):
     def construct(self):
+        self.rng = scene_rng(self)
         dGrid = NumberPlane(
             background_line_style={"stroke_opacity": 0.3},
             axis_config={"include_ticks": False, "stroke_opacity": 0}
@@ -10,23 +14,19 @@ class population(Scene):
         
         earth = Circle(radius=3, color=BLUE).set_fill(BLUE_E, opacity=0.6)
         self.play(FadeIn(earth, dGrid))
+        gridLayer = BackgroundLayer(self, dGrid).bake()
 
         num_dots = 150
         
-        red_dots = VGroup()
+        dot_positions = []
         for _ in range(num_dots):
-            dot = Dot(radius=0.05, color=RED)
-            rand_pos = earth.get_center() + random.uniform(-2.7, 2.7) * RIGHT + random.uniform(-2.7, 2.7) * UP
+            rand_pos = earth.get_center() + self.rng.uniform(-2.7, 2.7) * RIGHT + self.rng.uniform(-2.7, 2.7) * UP
 
             if np.linalg.norm(rand_pos - earth.get_center()) <= 2.9:
-                dot.move_to(rand_pos)
-                red_dots.add(dot)
+                dot_positions.append(rand_pos)
+        red_dots = DotCloud(dot_positions, radius=0.05, color=RED)
 
-        self.play(
-            LaggedStart(*[FadeIn(dot, scale=0.5) for dot in red_dots], 
-                       lag_ratio=0.02,    
-                       run_time=11.8)        
-        )
+        self.play(RevealDots(red_dots, lag_ratio=0.02, run_time=11.8))
         self.wait(1) 
 
         # === Part 1:how population growth
@@ -79,59 +79,11 @@ class population(Scene):
         rate_text.set_opacity(0)
         self.play(rate_text.animate.shift(UP * 0.3).set_opacity(1), run_time=1)
         self.wait(2.2)
+        gridLayer.release()
         self.play(FadeOut(birth_dots, earth_group, rate_text, dGrid))
         
         # === Part 2: Intro
-        main_text = MathTex(r"\ln \frac{dy}{dx}", font_size=120)
-        main_text.set_color_by_gradient(BLUE_B, GREEN_B)
-        
-        circles = VGroup()
-        for i in range(8):
-            circle = Circle(radius=0.5 + i * 0.3)
-            circle.set_stroke(BLUE, width=2, opacity=0.6 - i * 0.05)
-            circle.set_fill(opacity=0)
-            circles.add(circle)
-        
-        floating_symbols = VGroup()
-        symbols = [r"\int", r"\sum", r"\pi", r"e", r"\infty", r"\nabla"]
-        positions = [
-            UP * 2 + LEFT * 3,
-            UP * 1.5 + RIGHT * 4,
-            DOWN * 2 + LEFT * 4,
-            DOWN * 1.5 + RIGHT * 3,
-            UP * 3 + RIGHT * 2,
-            DOWN * 3 + LEFT * 2
-        ]
-        
-        for symbol, pos in zip(symbols, positions):
-            math_symbol = MathTex(symbol, font_size=60)
-            math_symbol.set_color(DARK_BLUE)
-            math_symbol.move_to(pos)
-            math_symbol.set_opacity(0.6)
-            floating_symbols.add(math_symbol)
-        
-        self.play(
-            LaggedStart(
-                *[FadeIn(symbol) for symbol in floating_symbols],
-                lag_ratio=0.2
-            ), LaggedStart(
-                *[Create(circle) for circle in circles],
-                lag_ratio=0.2
-            ),
-            run_time=1.2
-        )
-
-        self.play(
-            Write(main_text),
-            Rotate(circles, angle=2*PI, about_point=ORIGIN), 
-            run_time=1.5,
-            rate_func=linear
-        )
-        self.wait(0.8)
-        self.play(
-            FadeOut(circles), FadeOut(floating_symbols), FadeOut(main_text),
-            run_time=1.2
-        )
+        play_intro(self, symbol_lag_ratio=0.2, circle_lag_ratio=0.2, appear_run_time=1.2, write_run_time=1.5, fade_run_time=1.2)
         self.wait(0.5)
         
          # === Part 3: Formula / Equation ===
@@ -139,6 +91,7 @@ class population(Scene):
         logistic_title = Text("The Logistic Model", font_size=44, gradient=(BLUE, GREEN)).to_edge(UP)
         equation = MathTex(r"\frac{dP}{dt} = rP\left(1 - \frac{P}{K} \right)").scale(1.1)
         self.play(FadeIn(logistic_title), Write(equation), FadeIn(dGrid))
+        gridLayer.bake()
         self.wait(3)
 
         self.play(equation.animate.to_corner(UL).shift(DOWN).set_color_by_gradient(GREEN_B, BLUE_B).scale(0.9))
@@ -180,6 +133,7 @@ class population(Scene):
         self.play(equal.animate.shift(UP * 0.3).set_opacity(1), run_time=1)
         self.wait(4.5)
   
+        gridLayer.release()
         self.play(FadeOut(dGrid, logistic_title, equation, explanation, less, equal, approach, how))
         self.wait(0.5)
         
@@ -1,4 +1,5 @@
 from manim import *
+from background import BackgroundLayer
 import numpy as np
 
 class LogisticPopulation(Scene):
@@ -9,6 +10,7 @@ class LogisticPopulation(Scene):
         )
         
         self.play(FadeIn(dGrid)) 
+        gridLayer = BackgroundLayer(self, dGrid).bake()
         self.wait(0.4)
         
         # Simulation
@@ -153,6 +155,7 @@ class LogisticPopulation(Scene):
             run_time=1
         )
         
+        gridLayer.release()
         self.play(
             FadeOut(dGrid), FadeOut(axes), FadeOut(x_label), FadeOut(y_label), FadeOut(info_2),
             FadeOut(x_ticks), FadeOut(y_ticks), FadeOut(x_tick_labels), FadeOut(y_tick_labels),
@@ -1,6 +1,9 @@
 from manim import *
+from background import BackgroundLayer
 import numpy as np
-import math
+from taylor import PartialSumCache
+from plotting import adaptive_plot, adaptive_samples, plot_samples
+from scene_params import scene_param
 
 class TaylorSeries(Scene):
     def construct(self):
@@ -22,6 +25,7 @@ class TaylorSeries(Scene):
         ).scale(0.8)
         
         self.play(FadeIn(dGrid))
+        BackgroundLayer(self, dGrid).bake()
         self.wait(0.2)
         
         self.play(FadeIn(title, shift=UP), title.animate.shift(DOWN*0.6), run_time=1)
@@ -34,87 +38,61 @@ class TaylorSeries(Scene):
         self.play(Create(axes), run_time=1)  
         self.wait(0.5)
         
+        # Number of approximations shown per function (20-50 for convergence demos)
+        max_terms = scene_param("max_terms", 5)
+        
         # Create a function & their series
         functions = [
             {
                 "name": r"\sin(x)",
+                "taylor": "sin",
+                "approx_range": [-6, 6],
                 "series": r"\sum_{n=0}^{\infty} \frac{(-1)^n x^{2n+1}}{(2n+1)!}",
                 "func": lambda x: np.sin(x),
                 "color": BLUE_B
             },
             {
                 "name": r"\cos(x)",
+                "taylor": "cos",
+                "approx_range": [-6, 6],
                 "series": r"\sum_{n=0}^{\infty} \frac{(-1)^n x^{2n}}{(2n)!}",
                 "func": lambda x: np.cos(x),
                 "color": GREEN_B
             },
             {
                 "name": r"e^x",
+                "taylor": "exp",
+                "approx_range": [-6, 6],
                 "series": r"\sum_{n=0}^{\infty} \frac{x^n}{n!}",
                 "func": lambda x: np.exp(x),
                 "color": YELLOW_B
             },
             {
                 "name": r"\ln(1 + x)",
+                "taylor": "log1p",
+                "approx_range": [-0.9, 6],
                 "series": r"\sum_{n=1}^{\infty} \frac{(-1)^{n+1} x^n}{n}",
                 "func": lambda x: np.log(1 + x) if x > -1 else 0,
                 "color": BLUE_B
             },
             {
                 "name": r"\frac{1}{1-x}",
+                "taylor": "geometric",
+                "approx_range": [-0.9, 0.9],
                 "series": r"\sum_{n=0}^{\infty} x^n",
                 "func": lambda x: 1/(1-x) if abs(x) < 1 else 0,
                 "color": GREEN_B
             },
             {
                 "name": r"e^{-x^2}",
+                "taylor": "gaussian",
+                "approx_range": [-3, 3],
                 "series": r"\sum_{n=0}^{\infty} \frac{(-1)^n x^{2n}}{n!}",
                 "func": lambda x: np.exp(-x**2),
                 "color": YELLOW_B
             }
         ]
         
-        # Function approximation   
-        def sin_taylor(x, n_terms):
-            result = 0
-            for n in range(n_terms):
-                result += (-1)**n * (x**(2*n + 1)) / math.factorial(2*n + 1)
-            return result
-        
-        def cos_taylor(x, n_terms):
-            result = 0
-            for n in range(n_terms):
-                result += (-1)**n * (x**(2*n)) / math.factorial(2*n)
-            return result
-        
-        def exp_taylor(x, n_terms):
-            result = 0
-            for n in range(n_terms):
-                result += (x**n) / math.factorial(n)
-            return result
-        
-        def natural_log_taylor(x, n_terms):
-            result = 0
-            for n in range(1, n_terms + 1):
-                result += (-1)**(n+1) * (x**n) / n
-            return result
-        
-        def geometric_taylor(x, n_terms):
-            result = 0
-            for n in range(n_terms):
-                result += x**n
-            return result
-        
-        def gaussian_taylor(x, n_terms):
-            result = 0
-            for n in range(n_terms):
-                result += ((-1)**n) * (x**(2*n)) / math.factorial(n)
-            return result
-        
-        taylor_function = [
-            sin_taylor, cos_taylor, exp_taylor, natural_log_taylor, geometric_taylor, gaussian_taylor
-            ]
-        
         # Create equations
         eq_group = VGroup()
         
@@ -132,50 +110,34 @@ class TaylorSeries(Scene):
             
             # Create the actual fn (Graph)
             if func_data["name"] == r"\ln(1 + x)":
-                func_graph = axes.plot(func_data["func"], x_range=[-0.9, 5.5, 0.01], color=func_data["color"])
+                func_graph = adaptive_plot(axes, func_data["func"], x_range=[-0.9, 5.5], color=func_data["color"])
             elif func_data["name"] == r"\frac{1}{1-x}":
-                func_graph = axes.plot(func_data["func"], x_range=[-0.8, 0.9, 0.01], color=func_data["color"])
+                func_graph = adaptive_plot(axes, func_data["func"], x_range=[-0.8, 0.9], color=func_data["color"])
             elif func_data["name"] == r"e^{-x^2}":
-                func_graph = axes.plot(func_data["func"], x_range=[-4, 4, 0.01], color=func_data["color"])
+                func_graph = adaptive_plot(axes, func_data["func"], x_range=[-4, 4], color=func_data["color"])
             else:
-                func_graph = axes.plot(func_data["func"], x_range=[-6, 6, 0.01], color=func_data["color"])
+                func_graph = adaptive_plot(axes, func_data["func"], x_range=[-6, 6], color=func_data["color"])
             
             # Create Taylor approximations w/ increasing terms
+            # All partial sums come from one cumulative pass over an adaptive grid shared by every approximation
             approximations = []
             colors = [BLUE_A, GREEN_A, YELLOW_A]
+            xs, partial_sums = adaptive_samples(
+                axes,
+                lambda x: PartialSumCache(func_data["taylor"], x).partial_sums(max_terms),
+                func_data["approx_range"],
+                vectorized=True
+            )
             
-            for n_terms in range(1, 6):
+            for n_terms in range(1, max_terms + 1):
                 color_index = min(n_terms-1, len(colors)-1)  
-                
-                if func_data["name"] == r"\ln(1 + x)":
-                    approx_graph = axes.plot(
-                        lambda x, n=n_terms: taylor_function[i](x, n), 
-                        x_range=[-0.9, 6, 0.01], 
-                        color=colors[color_index],
-                        stroke_width=2
-                    )
-                elif func_data["name"] == r"\frac{1}{1-x}":
-                    approx_graph = axes.plot(
-                        lambda x, n=n_terms: taylor_function[i](x, n), 
-                        x_range=[-0.9, 0.9, 0.01], 
-                        color=colors[color_index],
-                        stroke_width=2
-                    )
-                elif func_data["name"] == r"e^{-x^2}":
-                    approx_graph = axes.plot(
-                        lambda x, n=n_terms: taylor_function[i](x, n),
-                        x_range=[-3, 3, 0.01],
-                        color=colors[color_index],
-                        stroke_width=2
-                    )
-                else:
-                    x_range_plot = [-6, 6, 0.01]
-                    approx_graph = axes.plot(
-                        lambda x, n=n_terms: taylor_function[i](x, n), 
-                        x_range=x_range_plot, 
-                        color=colors[color_index],
-                        stroke_width=2
-                    )
+                approx_graph = plot_samples(
+                    axes,
+                    xs,
+                    partial_sums[n_terms - 1],
+                    color=colors[color_index],
+                    stroke_width=2
+                )
                 approximations.append(approx_graph)
             
             # Show original function
@@ -1,4 +1,5 @@
 from manim import *
+from background import BackgroundLayer
 
 class BayesTheorem(Scene):
     def construct(self):
@@ -8,6 +9,7 @@ class BayesTheorem(Scene):
             axis_config={"include_ticks": False, "stroke_opacity": 0}
         )
         self.play(FadeIn(dGrid))
+        gridLayer = BackgroundLayer(self, dGrid).bake()
 
         title = Text("Bayes' Theorem", font_size=60).set_color_by_gradient(BLUE_B, GREEN_B)
         subtitle = Text("Updating beliefs based on new evidence!", font_size=36).set_color_by_gradient(BLUE_B, GREEN_B)
@@ -162,6 +164,7 @@ class BayesTheorem(Scene):
         self.play(Create(box))
         self.wait(2.4)
         
+        gridLayer.release()
         self.play(FadeOut(box), FadeOut(final_formula), FadeOut(conclusion_text), 
                   FadeOut(conclusion_title), FadeOut(dGrid))
 
@@ -1,4 +1,5 @@
 from manim import *
+from background import BackgroundLayer
 
 class combination(Scene):
     def construct(self):
@@ -8,6 +9,7 @@ class combination(Scene):
             axis_config={"include_ticks": False, "stroke_opacity": 0}
         )
         self.play(FadeIn(dGrid))
+        gridLayer = BackgroundLayer(self, dGrid).bake()
 
         title = Text("Combination", font_size=60).set_color_by_gradient(BLUE_B, GREEN_B)
         subtitle = Text("Arranging objects where order doesn't matter!", font_size=36).set_color_by_gradient(BLUE_B, GREEN_B)
@@ -223,6 +225,7 @@ class combination(Scene):
     
         self.play(Create(highlight))
         self.wait(0.8)
+        gridLayer.release()
         self.play(FadeOut(highlight), FadeOut(final_formula), FadeOut(dGrid))
 
 # manim -pqh Manim/Combination.py 
\ No newline at end of file
@@ -1,8 +1,12 @@
 from manim import *
+from segments import mark_segment
+from background import BackgroundLayer
+from widgets import resize_brace
 
 class derivative(Scene):
     def construct(self):
         # -------------- Scene 1 ------------------ #
+        mark_segment(self, "Scene 1")
         dGrid = NumberPlane(
             background_line_style={
                 "stroke_opacity": 0.4
@@ -13,6 +17,7 @@ class derivative(Scene):
             }
         )
         self.play(FadeIn(dGrid))
+        gridLayer = BackgroundLayer(self, dGrid).bake()
 
         intro = Text("Defining The Derivative", font_size=64).shift(3.4*UP).set_color_by_gradient(BLUE_B, GREEN_B)
         noteTxt = Text("Remember!").shift(2*UP).set_color_by_gradient(GREEN_B, BLUE_B)
@@ -31,6 +36,7 @@ class derivative(Scene):
         self.play(FadeOut(intro), FadeOut(noteTxt), FadeOut(highlightSq), FadeOut(gradient))
 
         # -------------- Scene 2 ------------------ #
+        mark_segment(self, "Scene 2")
         axes = Axes(
             x_range=[0, 8, 1],
             x_length=10,
@@ -108,6 +114,7 @@ class derivative(Scene):
         )
 
         # -------------- Scene 3 ------------------ #
+        mark_segment(self, "Scene 3")
         delY_eq = MathTex("\\Delta y = f(x+h) - f(x)").to_edge(DL).shift(2 * UP)
         delX_eq = MathTex("\\Delta x = x + h - x = h").to_edge(DL).shift(UP)
 
@@ -147,46 +154,74 @@ class derivative(Scene):
             scene2_group.animate.scale(1.8).move_to(ORIGIN))
 
         # -------------- Scene 4 ------------------ #
+        mark_segment(self, "Scene 4")
         h_values = [2, 1.5, 1, 0.5, 0.2, 0.1, 0.00001]
         scaleFactor = 0.6
+        hTracker = ValueTracker(h_values[0])
 
-        for h_val in h_values:
-            new_xh = x + h_val
-            new_pointP = axes.coords_to_point(new_xh, dFunction(new_xh))
-            new_pointQ = axes.coords_to_point(x, dFunction(x))
-            new_dotP = Dot(new_pointP)
-            
-            new_secantLine = axes.get_secant_slope_group(
-                x, dGraph, dx=h_val, secant_line_color=GREEN, secant_line_length=7
-            )
-            
-            new_dashedLine_xh = DashedLine(
-                start=new_pointP,
-                end=axes.coords_to_point(new_xh, 0)
-            )
-            
-            new_brace_h = BraceBetweenPoints(
-                axes.coords_to_point(x, -0.8),
-                axes.coords_to_point(new_xh, 0),
-                direction=DOWN
-            )
-            new_labelQ = MathTex("Q").next_to(new_pointP, UP).scale(scaleFactor)
-            new_label_h = MathTex("\\Delta x").next_to(new_brace_h, DOWN).scale(scaleFactor)
-            
-            new_brace_f = BraceBetweenPoints(new_pointQ, new_pointP, direction=RIGHT)
-            new_label_f = MathTex("\\Delta y").next_to(new_brace_f, RIGHT).scale(scaleFactor)
-            
-            new_label_fx = MathTex("f(x)").move_to(axes.coords_to_point(0.3, dFunction(x))).shift(1.5*LEFT*scaleFactor).scale(scaleFactor)
-            new_label_fxh = MathTex("f(x+h)").move_to(axes.coords_to_point(0.3, dFunction(new_xh))).shift(1.9*LEFT*scaleFactor).scale(scaleFactor)
-            
-            new_label_x = MathTex("x").move_to(axes.coords_to_point(x, 0)).shift(0.4*DOWN*scaleFactor).scale(scaleFactor)
-            new_label_xh = MathTex("x+h").move_to(axes.coords_to_point(new_xh, 0)).shift(0.4*DOWN*scaleFactor).scale(scaleFactor)
-            
+        secantPieces = VGroup(
+            dotP, secantLine, dashedLine_xh,
+            brace_h, label_h, brace_f, label_f,
+            label_fxh, label_xh, labelQ
+        )
+
+        def placeSecantPieces(pieces, h_val, settle=False):
+            # Moves the Scene 2 pieces to where they belong for h_val; labels are only re-positioned.
+            # The braces are built once when the pieces settle, then only resized in place.
+            dot, secant, dashed, braceH, labelH, braceF, labelF, labelFxh, labelXh, labelOnP = pieces
+            gapF = braceF.get_left()[0] - dot.get_x()
+            xh_val = x + h_val
+            pQ = axes.coords_to_point(x, dFunction(x))
+            pP = axes.coords_to_point(xh_val, dFunction(xh_val))
+            pXh = axes.coords_to_point(xh_val, 0)
+            pH = axes.coords_to_point(x, -0.8)
+
+            corner = pP[0] * RIGHT + pQ[1] * UP
+            center = (pQ + pP) / 2
+            halfSecant = normalize(pP - pQ) * 7 / 2
+
+            dot.move_to(pP)
+            secant.dx_line.set_points_by_ends(pQ, corner)
+            secant.df_line.set_points_by_ends(corner, pP)
+            secant.secant_line.set_points_by_ends(center - halfSecant, center + halfSecant)
+            dashed.put_start_and_end_on(pP, pXh)
+
+            if settle:
+                braceH.become(BraceBetweenPoints(pH, pXh, direction=DOWN))
+                braceF.become(BraceBetweenPoints(pQ, pP, direction=RIGHT))
+            else:
+                resize_brace(braceH, pH[0], pXh[0], axis=0)
+                resize_brace(braceF, pQ[1], pP[1], axis=1)
+                braceF.shift((pP[0] + gapF - braceF.get_left()[0]) * RIGHT)
+            labelH.next_to(braceH, DOWN)
+            labelF.next_to(braceF, RIGHT)
+
+            labelFxh.move_to(axes.coords_to_point(0.3, dFunction(xh_val))).shift(1.9*LEFT*scaleFactor)
+            labelXh.move_to(pXh).shift(0.4*DOWN*scaleFactor)
+            labelOnP.next_to(pP, UP)
+            return pieces
+
+        # First step: settle the labels at their Scene 4 size, then only h changes
+        settledPieces = secantPieces.copy()
+        settled_fx = label_fx.copy()
+        settled_x = label_x.copy()
+        settledLabels = [settledPieces[i] for i in (4, 6, 7, 8, 9)] + [settled_fx, settled_x]
+        for label in settledLabels:
+            label.font_size = scaleFactor * DEFAULT_FONT_SIZE
+        placeSecantPieces(settledPieces, h_values[0], settle=True)
+        settled_fx.move_to(axes.coords_to_point(0.3, dFunction(x))).shift(1.5*LEFT*scaleFactor)
+        settled_x.move_to(axes.coords_to_point(x, 0)).shift(0.4*DOWN*scaleFactor)
+
+        self.play(
+            Transform(secantPieces, settledPieces), Transform(label_fx, settled_fx), Transform(label_x, settled_x),
+            run_time=0.8
+        )
+        self.wait(0.5)
+
+        for h_val in h_values[1:]:
             self.play(
-                Transform(dotP, new_dotP), Transform(secantLine, new_secantLine), Transform(dashedLine_xh, new_dashedLine_xh),
-                Transform(brace_h, new_brace_h), Transform(label_h, new_label_h), Transform(brace_f, new_brace_f),
-                Transform(label_f, new_label_f), Transform(label_fx, new_label_fx), Transform(label_fxh, new_label_fxh),
-                Transform(label_x, new_label_x), Transform(label_xh, new_label_xh), Transform(labelQ, new_labelQ),
+                hTracker.animate.set_value(h_val),
+                UpdateFromFunc(secantPieces, lambda pieces: placeSecantPieces(pieces, hTracker.get_value())),
                 run_time=0.8
             )
             self.wait(0.5)
@@ -204,6 +239,7 @@ class derivative(Scene):
         )
 
         # -------------- Scene 5 ------------------ #
+        mark_segment(self, "Scene 5")
         derivativeDef = MathTex("m", "=", "\\lim_{h \\to 0}", "\\frac{f(x + h) - f(x)}{h}",
             font_size=64).set_color_by_gradient(BLUE_B, GREEN_B).shift(0.6 * RIGHT)
         
@@ -223,6 +259,7 @@ class derivative(Scene):
         self.play(Create(highlight_full), run_time=1, rate_func=smooth)
         self.wait(0.6)
 
+        gridLayer.release()
         self.play(FadeOut(dGrid), FadeOut(derivativeDef), FadeOut(dFx),
         FadeOut(highlight_full) ,run_time=1
         )
@@ -1,4 +1,9 @@
 from manim import *
+from background import BackgroundLayer
+from riemann import RiemannSum, RiemannTransform
+from quadrature import reference_integral, sum_and_error
+from widgets import CounterLabel
+from scene_params import scene_param
 
 class integral(Scene):
     def construct(self):
@@ -13,6 +18,7 @@ class integral(Scene):
             }
         )
         self.play(FadeIn(dGrid))
+        gridLayer = BackgroundLayer(self, dGrid).bake()
 
         intro = Text("Integral Visualization", font_size=64).shift(3.4*UP).set_color_by_gradient(GREEN_B, BLUE_B)
         
@@ -32,14 +38,30 @@ class integral(Scene):
 
         labels = axes.get_axis_labels(x_label="x", y_label="y")
         graph = axes.plot(curve, x_range=[0, 3], color=(BLUE, GREEN))
-        rects = axes.get_riemann_rectangles(
-            graph,
+        rects = RiemannSum(
+            axes, curve,
             x_range=[0, 3],
-            dx=0.5, 
+            dx=0.5,
             color=(BLUE, GREEN),
-            input_sample_type="right",  
+            sample_type="right",
+            vectorized=True
         )
 
+        # Live Riemann sum and its error against the reference integral, driven by dxTracker
+        reference = reference_integral(curve, [0, 3], vectorized=True)
+        dxTracker = ValueTracker(0.5)
+        sumCounter = CounterLabel("Sum", 0, font_size=28, num_decimal_places=4)
+        errorCounter = CounterLabel("Error", 0, font_size=28, num_decimal_places=4)
+        counters = VGroup(sumCounter, errorCounter).arrange(DOWN, aligned_edge=LEFT).to_edge(RIGHT).shift(0.4*UP)
+
+        def updateCounters(group):
+            total, error = sum_and_error(curve, [0, 3], dxTracker.get_value(), "right", reference, vectorized=True)
+            sumCounter.set_value(total)
+            errorCounter.set_value(error)
+            return group
+
+        updateCounters(counters)
+
         x = 1.5
         brace_delX = BraceBetweenPoints(
             axes.coords_to_point(x - 0.5, 0), 
@@ -63,7 +85,7 @@ class integral(Scene):
 
         self.play(FadeIn(axes), Create(graph))
         self.play(Write(labels), Write(fx_label),
-                Create(rects), Write(title_sum), Write(sumIntegralFormula), run_time=1)
+                Create(rects), FadeIn(counters), Write(title_sum), Write(sumIntegralFormula), run_time=1)
         self.wait(0.6)
         self.play(GrowFromCenter(brace_delX), Write(label_delX), Create(dashed_line_horiz), Write(fxi_label),  run_time=0.8)
         self.wait(0.6)
@@ -73,19 +95,17 @@ class integral(Scene):
         pointA = MathTex("a", font_size=64).next_to(axes.coords_to_point(0, 0)).shift(0.4*LEFT + 0.9*DOWN)
         pointB = MathTex("b", font_size=64).next_to(axes.coords_to_point(3, 0)).shift(0.4*LEFT + 0.9*DOWN)
         
-        for dx in [0.5, 0.2, 0.1, 0.05, 0.01]:
-            new_rects = axes.get_riemann_rectangles(
-                graph,
-                x_range=[0, 3],
-                dx=dx,
-                color=(BLUE, GREEN),
-                input_sample_type="right",
+        for dx in [0.5, 0.2, 0.1, 0.05, 0.01, scene_param("final_dx", 0.001)]:
+            self.play(
+                RiemannTransform(rects, rects.with_dx(dx)),
+                dxTracker.animate.set_value(dx),
+                UpdateFromFunc(counters, updateCounters),
+                run_time=0.9
             )
-            self.play(Transform(rects, new_rects), run_time=0.9)
 
         area = axes.get_area(graph, x_range=[0, 3], color=(GREEN, BLUE), opacity=0.6)
         self.play(
-            Write(pointA), Write(pointB), FadeOut(rects), FadeIn(area), Transform(title_sum, title_integral), Transform(sumIntegralFormula, integralFormula))
+            Write(pointA), Write(pointB), FadeOut(rects), FadeOut(counters), FadeIn(area), Transform(title_sum, title_integral), Transform(sumIntegralFormula, integralFormula))
         self.wait(0.9)
 
         # -------------- Scene 4 ------------------ #
@@ -147,7 +167,7 @@ class integral(Scene):
         ).align_on_border(LEFT).shift(1.6*UP + 0.1*LEFT).set_color_by_gradient(BLUE_B, GREEN_B)
         intFn_St2 = MathTex(
             r"\frac{3^3}{3} - \frac{0^3}{3} = 9", font_size=41).align_on_border(LEFT).shift(0.1*UP + 0.1*LEFT).set_color_by_gradient(BLUE_B, GREEN_B)
-        result = MathTex("Area = 9").move_to(sceneGroup).set_color_by_gradient(GREEN_B, BLUE_B).shift(0.9*RIGHT + 2*DOWN)
+        result = MathTex(f"Area = {reference:g}").move_to(sceneGroup).set_color_by_gradient(GREEN_B, BLUE_B).shift(0.9*RIGHT + 2*DOWN)
     
         self.play(Write(intFn_St1))
         self.wait(0.5)
@@ -156,6 +176,7 @@ class integral(Scene):
         self.play(FadeOut(intFn_St1), FadeOut(intFn_St2), FadeOut(polynomial_integral), FadeIn(result), 
                 sceneGroup.animate.scale(1.4).move_to(ORIGIN))
         self.wait(0.7)
+        gridLayer.release()
         self.play(FadeOut(sceneGroup), FadeOut(result), FadeOut(dGrid), run_time=1.6)
         self.wait(0.4)
 
@@ -1,4 +1,7 @@
 from manim import *
+from background import BackgroundLayer
+from widgets import TrackedFunction, TrackedDot, follow_value
+from reactive import UpdateGraph
 
 class limitVisualization(Scene):
     def construct(self):
@@ -13,6 +16,7 @@ class limitVisualization(Scene):
             }
         )
         self.play(FadeIn(dGrid))
+        gridLayer = BackgroundLayer(self, dGrid).bake()
 
         intro = Text("Limit Visualization", font_size=64).shift(3.4*UP).set_color_by_gradient(BLUE_B, PINK)
         fn = MathTex("f(x)= \, \\frac{\\sin(x)}{x}", font_size=80).shift(UP).set_color_by_gradient(PINK, BLUE_B)
@@ -55,36 +59,27 @@ class limitVisualization(Scene):
         leftLim_tracker = ValueTracker(-0.99)
         rightLim_tracker = ValueTracker(0.99)
 
-        left_dot = always_redraw(
-            lambda: 
-                Dot(point=ax.c2p(leftLim_tracker.get_value(), np.sin(leftLim_tracker.get_value())/leftLim_tracker.get_value()), color=RED_A)
-        )
-        right_dot = always_redraw(
-            lambda:
-                Dot(point=ax.c2p(rightLim_tracker.get_value(), np.sin(rightLim_tracker.get_value())/rightLim_tracker.get_value()), color=GREEN_A)
-        )
+        # Both the dots and the numbers read f from one shared cache per side
+        sinc = lambda x: np.sin(x)/x
+        leftValue = TrackedFunction(leftLim_tracker, sinc)
+        rightValue = TrackedFunction(rightLim_tracker, sinc)
+
+        left_dot = TrackedDot(ax, leftValue, color=RED_A)
+        right_dot = TrackedDot(ax, rightValue, color=GREEN_A)
 
         leftDec = DecimalNumber(
             0, include_sign=True,
             num_decimal_places=7,
             color=RED_A,
             font_size=30
-        ).add_updater(
-            lambda m: m.set_value(
-                np.sin(leftLim_tracker.get_value()) / leftLim_tracker.get_value()
-            ).next_to(left_dot, LEFT)
-        )
+        ).add_updater(lambda m: follow_value(m, leftValue, left_dot, LEFT))
 
         rightDec = DecimalNumber(
             0, include_sign=True,
             num_decimal_places=7,
             color=GREEN_A,
             font_size=30
-        ).add_updater(
-            lambda m: m.set_value(
-                np.sin(rightLim_tracker.get_value()) / rightLim_tracker.get_value()
-            ).next_to(right_dot, RIGHT)
-        )
+        ).add_updater(lambda m: follow_value(m, rightValue, right_dot, RIGHT))
 
         leftLim = MathTex("\\lim_{x \\to 0^-} f(x)", font_size=40)
         rightLim = MathTex("\\lim_{x \\to 0^+} f(x)", font_size=40)
@@ -92,6 +87,16 @@ class limitVisualization(Scene):
         leftLim.add_updater(lambda m: m.next_to(leftDec, UP))
         rightLim.add_updater(lambda m: m.next_to(rightDec, UP))
 
+        # tracker -> dot -> number -> limit label; a chain only re-runs when its tracker moved
+        limitUpdates = UpdateGraph()
+        limitUpdates.bind(left_dot, leftLim_tracker)
+        limitUpdates.bind(right_dot, rightLim_tracker)
+        limitUpdates.bind(leftDec, leftLim_tracker, left_dot)
+        limitUpdates.bind(rightDec, rightLim_tracker, right_dot)
+        limitUpdates.bind(leftLim, leftDec)
+        limitUpdates.bind(rightLim, rightDec)
+        self.add(limitUpdates.refresh())
+
         self.play(FadeIn(left_dot, right_dot, leftDec, rightDec, leftLim, rightLim))
         self.play(
             leftLim_tracker.animate.set_value(-0.001),
@@ -102,8 +107,7 @@ class limitVisualization(Scene):
         self.play(FadeOut(left_dot, right_dot, leftDec, rightDec, graph, label, ax, run_time=0.3))
 
         # -------------- Scene 5 ------------------ #
-        leftLim.clear_updaters()
-        rightLim.clear_updaters()
+        self.remove(limitUpdates)
 
         self.play(
             leftLim.animate.move_to(ORIGIN + 2*LEFT).scale(1.8),
@@ -136,6 +140,7 @@ class limitVisualization(Scene):
         self.play(Write(limFnResult))
         self.wait(1)
 
+        gridLayer.release()
         self.play(FadeOut(txt4, limFnResult, dGrid, run_time=0.5))
         self.wait(1)
 
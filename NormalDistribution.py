@@ -1,9 +1,15 @@
 from manim import *
+from background import BackgroundLayer
 import numpy as np
-import random
+from scene_rng import scene_rng
+from galton import GaltonPaths, BallScheduler, flight_positions, tail_point, stack_histogram, binomial_histogram
+from widgets import DotCloud
+from segments import mark_segment
+from scene_params import scene_param
 
 class NormalDistribution(Scene):
     def construct(self):
+        self.rng = scene_rng(self)
         self.normal_distribution_animation()
         self.wait(1)
 
@@ -28,10 +34,12 @@ class NormalDistribution(Scene):
         self.play(Create(curve, run_time=1.5))
         
         self.wait(2)
+        self.gridLayer.release()
         self.play(*[FadeOut(mob) for mob in self.mobjects])
 
     def normal_distribution_animation(self):
         # === Part 1: Grid & Intro ===
+        mark_segment(self, "Part 1: Grid & Intro")
         self.dGrid = NumberPlane(
             background_line_style={
                 "stroke_opacity": 0.4
@@ -42,6 +50,7 @@ class NormalDistribution(Scene):
             }
         )
         self.play(FadeIn(self.dGrid))
+        self.gridLayer = BackgroundLayer(self, self.dGrid).bake()
         
         # Configuration parameters
         mean = 0
@@ -59,6 +68,7 @@ class NormalDistribution(Scene):
         self.play(FadeOut(explanation1), FadeOut(title), FadeOut(explanation2))
 
         # === Part 2: Create Normal Distribution Graph ===
+        mark_segment(self, "Part 2: Normal Distribution Graph")
         self.create_graph(x_min, x_max, y_max, mean, std_dev)
 
     def create_graph(self, x_min, x_max, y_max, mean, std_dev):
@@ -146,6 +156,7 @@ class NormalDistribution(Scene):
         self.empirical_rule()
 
     def empirical_rule(self):
+        mark_segment(self, "Empirical Rule")
         ER_title = Tex("Empirical Rule", font_size=48).shift(UP*3.4 + RIGHT*2.5)
         explanation3 = Tex("A rule in statistics that describes the distribution", font_size=32).shift(UP*2.5 + RIGHT*2.5)
         explanation4 = Tex("of data in a normal distribution", font_size=32).shift(UP*2 + RIGHT*2.5)
@@ -164,9 +175,10 @@ class NormalDistribution(Scene):
         self.play(FadeOut(explanation3), FadeOut(explanation4), FadeOut(expGroup), FadeOut(self.dGrouping), FadeOut(ER_title))
 
     def galton_board_animation(self):
+        mark_segment(self, "Galton Board")
         self.config = {
             "runTime": 9,
-            "itemsTotal" : 250, 
+            "itemsTotal" : scene_param("itemsTotal", 250), 
             "itemDelayFrames" : 1,
             "circleSize" : 0.2,  
             "circleVerticalShift" : 0.6,  
@@ -176,56 +188,82 @@ class NormalDistribution(Scene):
             "firstCircleCenterY" : 3,  
             "durationSeconds" : 2,
             "circleRadius" : 0.05,
-            "firstDot" : [-3, 4.3, 0]
+            "firstDot" : [-3, 4.3, 0],
+            "checkHistogram" : False
         }
         
-        self.frameNumber = 0
-
         # Galton board elements
         table = self.createTable()
         counter = self.createCounter()
         circles = self.createCircles()  
         vertices = self.createVertices()
-        items = self.createItems(vertices)
-
-        def updateFrameFunction(table):
-            durationSeconds = self.config["durationSeconds"]
-            durationFrames = durationSeconds * self.camera.frame_rate
-            self.frameNumber += 1
-
-            for item in items:
-                if item.isActive and self.frameNumber > item.startFrame:
-                    alpha = (self.frameNumber - item.startFrame) / durationFrames
-                    if (alpha <= 1.0) :
-                        point = item.path.point_from_proportion(rate_functions.linear(alpha))
-                        item.circle.move_to(point)     
-                    else:
-                        updateCounter()
-                        updateStackValue(item.stackIndex)
-                        item.isActive = False
-
-        def updateCounter():
+        paths = GaltonPaths(vertices, self.config["firstDot"], rows=self.config["circleRowsCount"])
+        items = self.createItems(paths)
+        balls = self.createBalls(items)
+
+        pathIndices = np.array([item.pathIndex for item in items])
+        tailPoints = np.array([item.tailPoint for item in items])
+        stackIndices = np.array([item.stackIndex for item in items])
+        stackCount = self.config["circleRowsCount"] + 1
+        durationFrames = self.config["durationSeconds"] * self.camera.frame_rate
+        scheduler = BallScheduler([item.startFrame for item in items], durationFrames)
+
+        def updateFrameFunction(table, alpha):
+            # The frame number comes from alpha, so a skipped play (segment renders) still lands every ball
+            frameNumber = int(round(alpha * runTime * self.camera.frame_rate)) + 1
+
+            # Only balls in flight are visited; finished and waiting ones cost nothing
+            moving, points, landed = flight_positions(paths, scheduler, pathIndices, tailPoints, frameNumber)
+
+            # Balls landing in the same frame are batched: each cell is re-typeset at most once per frame
+            if len(landed):
+                for index in landed:
+                    items[index].isActive = False
+                updateCounter(len(landed))
+                landedPerStack = np.bincount(stackIndices[landed], minlength=stackCount)
+                for stackIndex in np.flatnonzero(landedPerStack):
+                    updateStackValue(int(stackIndex), int(landedPerStack[stackIndex]))
+
+            if len(moving):
+                balls.set_positions(points, moving)
+
+        def updateCounter(count=1):
             val = counter[0].get_value()
-            val += 1
+            val += count
             counter[0].set_value(val)
 
-        def updateStackValue(stackValueIndex):
+        def updateStackValue(stackValueIndex, count=1):
             cell = table.get_entries((1, stackValueIndex + 1))
             val = cell.get_value()
-            val += 1
+            val += count
             cell.set_value(val)
 
         self.play(FadeIn(circles), FadeIn(table), FadeIn(counter), run_time=1) 
 
-        wrapper = VGroup(table, counter)
-        for item in items:
-            wrapper.add(item.circle)
+        wrapper = VGroup(table, counter, balls)
 
         runTime = self.config["runTime"]
-        self.play(UpdateFromFunc(wrapper, updateFrameFunction), run_time=runTime)
+        self.play(UpdateFromAlphaFunc(wrapper, updateFrameFunction, rate_func=linear), run_time=runTime)
+
+        if self.config["checkHistogram"]:
+            self.checkHistogram(table, stackIndices, scheduler.finished())
 
         self.wait(0.2)
 
+    def checkHistogram(self, table, stackIndices, allLanded):
+        # Compare the table with the stacks precomputed from the path indices and with the binomial theory
+        rows = self.config["circleRowsCount"]
+        finalCounts = stack_histogram(stackIndices, rows)
+        expected = binomial_histogram(len(stackIndices), rows)
+        tableCounts = [table.get_entries((1, k + 1)).get_value() for k in range(rows + 1)]
+
+        logger.info(f"Galton table:    {tableCounts}")
+        logger.info(f"Precomputed:     {finalCounts.tolist()}")
+        logger.info(f"Binomial theory: {np.round(expected, 1).tolist()}")
+
+        if allLanded and tableCounts != finalCounts.tolist():
+            logger.warning("Galton table does not match the precomputed stack histogram")
+
     def createTable(self):
         table = IntegerTable(
             [[0, 0, 0, 0, 0, 0, 0, 0],],
@@ -286,11 +324,9 @@ class NormalDistribution(Scene):
 
         return vertices
     
-    def createItems(self, vertices):
+    def createItems(self, paths):
         itemsTotal = self.config["itemsTotal"]
-        circleRadius = self.config["circleRadius"]
         itemDelayFrames = self.config["itemDelayFrames"]
-        firstDot = self.config["firstDot"]
 
         items = []
         startFrame = 0
@@ -298,75 +334,39 @@ class NormalDistribution(Scene):
 
         for k in range (itemsTotal):
             item = Item()
-            circle = Circle(radius=circleRadius, color=GREEN, fill_opacity=1)
             pathIndex = self.createPathIndex()
             stackIndex = pathIndex.bit_count()
             stackValues[stackIndex] += 1
 
-            path = self.createPath(vertices, pathIndex, stackValues[stackIndex])
-
-            item.path = path
-            item.circle = circle
+            item.pathIndex = pathIndex
+            item.tailPoint = tail_point(paths.ends[pathIndex], stackValues[stackIndex])
             item.stackIndex = stackIndex
             item.startFrame = startFrame
             
             startFrame += itemDelayFrames
 
-            self.add(circle)
-            circle.move_to(firstDot)
-
             items.append(item)
 
         return items  
 
-    def createPathIndex(self):
-        pathIndex = random.randrange(128)
-        return pathIndex
-    
-    def createPath(self, vertices, pathIndex, itemsCountInStack):
+    def createBalls(self, items):
+        # All balls live in one DotCloud; ball k is dot k of the cloud
+        circleRadius = self.config["circleRadius"]
         firstDot = self.config["firstDot"]
-        rowCapacity = 3
 
-        lastDotRowIndex = (itemsCountInStack - 1) // rowCapacity
-        lastDotColIndex = (itemsCountInStack - 1) % rowCapacity 
-        
-        path = Line(firstDot, vertices[0][0], stroke_width=1)
-        previousDot = vertices[0][0]
-        binary = bin(pathIndex)[2:].zfill(7)
-        rowIndex = 1
-        colIndex = 0
-        for digit in binary:
-            if digit == '0':
-                pathTmp = ArcBetweenPoints(previousDot, vertices[rowIndex][colIndex], angle=PI/2, stroke_width=1)
-                previousDot = vertices[rowIndex][colIndex]
-            else:
-                colIndex += 1
-                pathTmp = ArcBetweenPoints(previousDot, vertices[rowIndex][colIndex], angle=-PI/2, stroke_width=1)
-                previousDot = vertices[rowIndex][colIndex]
-            path.append_vectorized_mobject(pathTmp)
-            rowIndex += 1
-
-        lastDotWidth = 0.1
-        lastDotHeight = 0.1
-
-        lastDotX = previousDot[0]
-        
-        if lastDotColIndex == 0:
-            lastDotX = lastDotX - lastDotWidth
-        elif lastDotColIndex == 2:
-            lastDotX = lastDotX + lastDotWidth
-
-        lastDotY = previousDot[1] - 2.4 + lastDotHeight * lastDotRowIndex
+        balls = DotCloud([firstDot] * len(items), radius=circleRadius, color=GREEN)
+        self.add(balls)
 
-        pathLast = Line(previousDot, [lastDotX, lastDotY, 0] , stroke_width=1)
-        path.append_vectorized_mobject(pathLast)
+        return balls
 
-        return path    
+    def createPathIndex(self):
+        pathIndex = int(self.rng.integers(2 ** self.config["circleRowsCount"]))
+        return pathIndex
 
 
 class Item:
-    circle = None
-    path = None
+    pathIndex = 0
+    tailPoint = None
     startFrame = 0
     stackIndex = 0  
     isActive = True
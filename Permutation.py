@@ -1,4 +1,5 @@
 from manim import *
+from background import BackgroundLayer
 
 class permutation(Scene):
     def construct(self):
@@ -8,6 +9,7 @@ class permutation(Scene):
             axis_config={"include_ticks": False, "stroke_opacity": 0}
         )
         self.play(FadeIn(dGrid))
+        gridLayer = BackgroundLayer(self, dGrid).bake()
 
         title = Text("Permutation", font_size=48)
         subtitle = Text("Arranging objects where order matters", font_size=32)
@@ -143,6 +145,7 @@ class permutation(Scene):
         self.wait(0.8)
         self.play(Create(highlight))
         self.wait(1)
+        gridLayer.release()
         self.play(FadeOut(highlight), FadeOut(permutationEq), FadeOut(dGrid))
 
 # manim -pqm Manim/Permutation.py
\ No newline at end of file
@@ -0,0 +1,32 @@
+from manim import *
+
+
+class BackgroundLayer:
+    # Rasterizes mobjects that sit still for the whole video (the NumberPlane grid) once, at the
+    # output resolution, into the camera background. Every later frame starts from that image
+    # instead of redrawing their lines. release() puts the live mobjects back so they can be
+    # animated again, e.g. right before a FadeOut.
+    def __init__(self, scene, *mobjects):
+        self.scene = scene
+        self.mobjects = mobjects
+        self.camera = getattr(scene.renderer, "camera", None)
+        self.plain_background = None
+
+    def bake(self):
+        # The OpenGL renderer has no pixel background to draw into; the mobjects simply stay live
+        if self.camera is None or not hasattr(self.camera, "background") or self.plain_background is not None:
+            return self
+        self.plain_background = self.camera.background
+        self.camera.reset()
+        self.camera.capture_mobjects(self.mobjects)
+        self.camera.background = self.camera.pixel_array.copy()
+        self.scene.remove(*self.mobjects)
+        return self
+
+    def release(self):
+        if self.plain_background is None:
+            return self
+        self.camera.background = self.plain_background
+        self.plain_background = None
+        self.scene.bring_to_back(*self.mobjects)
+        return self
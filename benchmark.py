@@ -0,0 +1,208 @@
+import argparse
+import importlib.util
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from render_all import ROOT, discover_scenes
+from scene_params import PARAMS_ENV_VAR
+
+DEFAULT_RESOLUTION = (480, 270)
+DEFAULT_FRAME_RATE = 15
+# Scene -> (parameter read through scene_param, sizes to run)
+SCALING = {
+    "UABModel": ("total_agents", [250, 500, 1000, 2000]),
+    "NormalDistribution": ("itemsTotal", [125, 250, 500, 1000]),
+    "TaylorSeries": ("max_terms", [5, 10, 20, 40]),
+    "integral": ("final_dx", [0.01, 0.001, 0.0001]),
+}
+
+
+def peak_rss_mb():
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def run_scene(file_name, scene_name, width, height, frame_rate, media_dir):
+    # Child side: render one scene without writing a movie and time every play()/wait()
+    from manim import config, Animation
+    from tex_cache import enable_tex_cache
+
+    config.pixel_width = width
+    config.pixel_height = height
+    config.frame_rate = frame_rate
+    config.media_dir = media_dir
+    config.write_to_movie = False
+    config.disable_caching = True
+    config.verbosity = "ERROR"
+    enable_tex_cache()
+
+    spec = importlib.util.spec_from_file_location(f"benchmark_{Path(file_name).stem}", ROOT / file_name)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    scene = getattr(module, scene_name)()
+
+    plays = []
+    peak_mobjects = 0
+    original_play = scene.play
+
+    # wait() goes through play(Wait(...)), so wrapping play alone times both
+    def timed_play(*args, **kwargs):
+        nonlocal peak_mobjects
+        start = time.perf_counter()
+        start_time = scene.renderer.time
+        original_play(*args, **kwargs)
+        mobjects = len(scene.get_mobject_family_members())
+        peak_mobjects = max(peak_mobjects, mobjects)
+        plays.append({
+            "index": len(plays),
+            "seconds": round(time.perf_counter() - start, 4),
+            "frames": round((scene.renderer.time - start_time) * frame_rate),
+            "animations": [type(arg).__name__.lstrip("_") for arg in args if isinstance(arg, Animation) or hasattr(arg, "mobject")],
+            "mobjects": mobjects,
+        })
+
+    scene.play = timed_play
+    start = time.perf_counter()
+    scene.render()
+    total = time.perf_counter() - start
+    play_seconds = sum(play["seconds"] for play in plays)
+
+    return {
+        "total_seconds": round(total, 3),
+        "play_seconds": round(play_seconds, 3),
+        "construct_seconds": round(total - play_seconds, 3),
+        "frames": round(scene.renderer.time * frame_rate),
+        "peak_rss_mb": peak_rss_mb(),
+        "peak_mobjects": peak_mobjects,
+        "play_count": len(plays),
+        "plays": plays,
+    }
+
+
+def benchmark(file_name, scene, params, width, height, frame_rate, media_dir):
+    # Parent side: every run gets a fresh process, so RSS and caches do not leak between scenes
+    command = [
+        sys.executable, str(ROOT / "benchmark.py"), "--child", file_name, scene,
+        "--resolution", f"{width}x{height}", "--fps", str(frame_rate), "--media-dir", media_dir
+    ]
+    env = dict(os.environ, **{PARAMS_ENV_VAR: json.dumps(params)})
+    result = subprocess.run(command, cwd=ROOT, env=env, capture_output=True, text=True)
+
+    run = {"file": file_name, "scene": scene, "params": params, "returncode": result.returncode}
+    if result.returncode == 0:
+        run.update(json.loads(result.stdout.strip().splitlines()[-1]))
+    else:
+        run["error"] = result.stderr[-2000:]
+    return run
+
+
+def run_key(run):
+    return f"{run['scene']} {json.dumps(run['params'], sort_keys=True)}"
+
+
+def workload(run):
+    # What a run rendered: timings are only comparable between runs that rendered the same thing
+    return run.get("frames"), run.get("play_count", len(run.get("plays", [])))
+
+
+def compare(runs, baseline, threshold):
+    # A run regresses when its wall time or peak RSS grew by more than threshold over the baseline.
+    # Runs whose frame or play count changed since the baseline are reported as not comparable.
+    previous = {run_key(run): run for run in baseline["runs"] if run["returncode"] == 0}
+    regressions = []
+    mismatched = []
+    for run in runs:
+        old = previous.get(run_key(run))
+        if old is None or run["returncode"] != 0:
+            continue
+        if workload(old) != workload(run):
+            mismatched.append((run_key(run), workload(old), workload(run)))
+            continue
+        for metric in ("total_seconds", "peak_rss_mb"):
+            if old[metric] and run[metric] > old[metric] * (1 + threshold):
+                regressions.append((run_key(run), metric, old[metric], run[metric]))
+    return regressions, mismatched
+
+
+def benchmark_plan(only=None, scaling=True):
+    plan = []
+    for file_name, scene in discover_scenes():
+        if only and not any(pattern in file_name or pattern in scene for pattern in only):
+            continue
+        plan.append((file_name, scene, {}))
+        if scaling and scene in SCALING:
+            name, sizes = SCALING[scene]
+            plan.extend((file_name, scene, {name: size}) for size in sizes)
+    return plan
+
+
+if __name__ == "__main__":
+    # python benchmark.py                         -> every scene plus the scaling runs
+    # python benchmark.py --only Limit --no-scaling
+    # python benchmark.py --save-baseline         -> store this run as benchmarks/baseline.json
+    parser = argparse.ArgumentParser(description="Time every scene headlessly and compare against a baseline")
+    parser.add_argument("--child", nargs=2, metavar=("FILE", "SCENE"), help=argparse.SUPPRESS)
+    parser.add_argument("--only", nargs="*", default=None, help="substrings of file or scene names to run")
+    parser.add_argument("--no-scaling", action="store_true")
+    parser.add_argument("--resolution", default="x".join(map(str, DEFAULT_RESOLUTION)))
+    parser.add_argument("--fps", type=int, default=DEFAULT_FRAME_RATE)
+    parser.add_argument("--media-dir", default="media")
+    parser.add_argument("--output", default="benchmarks/results.json")
+    parser.add_argument("--baseline", default="benchmarks/baseline.json")
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--threshold", type=float, default=0.15)
+    args = parser.parse_args()
+    width, height = map(int, args.resolution.split("x"))
+
+    if args.child:
+        result = run_scene(*args.child, width, height, args.fps, args.media_dir)
+        print(json.dumps(result))
+        sys.exit(0)
+
+    runs = []
+    for file_name, scene, params in benchmark_plan(args.only, not args.no_scaling):
+        run = benchmark(file_name, scene, params, width, height, args.fps, args.media_dir)
+        runs.append(run)
+        if run["returncode"] == 0:
+            print(
+                f"{run_key(run)}: {run['total_seconds']}s, {run['frames']} frames, {run['play_count']} plays, "
+                f"{run['peak_rss_mb']} MB, {run['peak_mobjects']} mobjects"
+            )
+        else:
+            print(f"{run_key(run)}: failed ({run['returncode']})")
+
+    results = {
+        "settings": {"resolution": [width, height], "frame_rate": args.fps},
+        "python": sys.version.split()[0],
+        "runs": runs,
+    }
+    for path in [args.output] + ([args.baseline] if args.save_baseline else []):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(results, f, indent=2)
+
+    regressions = []
+    mismatched = []
+    if not args.save_baseline and Path(args.baseline).exists():
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline["settings"] != results["settings"]:
+            print("Baseline was recorded with different settings; not comparing")
+        else:
+            regressions, mismatched = compare(runs, baseline, args.threshold)
+    for key, (old_frames, old_plays), (new_frames, new_plays) in mismatched:
+        print(
+            f"NOT COMPARABLE {key}: {old_frames} -> {new_frames} frames, {old_plays} -> {new_plays} plays; "
+            "re-record the baseline with --save-baseline"
+        )
+    for key, metric, old, new in regressions:
+        print(f"REGRESSION {key}: {metric} {old} -> {new}")
+
+    failed = [run for run in runs if run["returncode"] != 0]
+    sys.exit(1 if regressions or failed else 0)
@@ -0,0 +1,150 @@
+import math
+import numpy as np
+
+PI_2 = np.pi / 2
+
+
+def arc_points(start, end, angle, samples):
+    # Same geometry as ArcBetweenPoints(start, end, angle): counter-clockwise for angle > 0
+    start = np.asarray(start, dtype=float)
+    end = np.asarray(end, dtype=float)
+    chord = end - start
+    normal = np.array([-chord[1], chord[0], 0.0])
+    center = (start + end) / 2 + normal * 0.5 / np.tan(angle / 2)
+    radius = np.linalg.norm(start - center)
+    start_angle = np.arctan2(start[1] - center[1], start[0] - center[0])
+    angles = start_angle + angle * np.linspace(0, 1, samples)
+    return center + radius * np.column_stack((np.cos(angles), np.sin(angles), np.zeros(samples)))
+
+
+class GaltonPaths:
+    # Every peg route (2**rows of them) as a dense polyline with a cumulative arc-length table.
+    # A ball's path is its route followed by a straight tail down to its slot in the stack.
+    def __init__(self, vertices, first_dot, rows=7, samples_per_arc=16):
+        self.rows = rows
+        self.route_count = 2 ** rows
+
+        routes = [self.route_points(vertices, first_dot, index, samples_per_arc) for index in range(self.route_count)]
+        self.points = np.array(routes)
+        segments = np.linalg.norm(np.diff(self.points, axis=1), axis=2)
+        self.cumulative = np.concatenate((np.zeros((self.route_count, 1)), np.cumsum(segments, axis=1)), axis=1)
+        self.lengths = self.cumulative[:, -1]
+        self.ends = self.points[:, -1]
+
+        # Offsetting each route's table by route * stride lets one searchsorted cover all routes
+        self.stride = self.lengths.max() + 1.0
+        self.flat_cumulative = (self.cumulative + np.arange(self.route_count)[:, None] * self.stride).ravel()
+        self.flat_points = self.points.reshape(-1, 3)
+        self.points_per_route = self.points.shape[1]
+
+    def route_points(self, vertices, first_dot, path_index, samples):
+        points = [np.asarray(first_dot, dtype=float), np.asarray(vertices[0][0], dtype=float)]
+        previous = vertices[0][0]
+        col = 0
+        for row, digit in enumerate(bin(path_index)[2:].zfill(self.rows), start=1):
+            if digit == '0':
+                arc = arc_points(previous, vertices[row][col], PI_2, samples)
+            else:
+                col += 1
+                arc = arc_points(previous, vertices[row][col], -PI_2, samples)
+            points.extend(arc[1:])
+            previous = vertices[row][col]
+        return np.array(points)
+
+    def positions(self, routes, tails, alphas):
+        # Points at proportion alphas along route + tail, for many balls at once
+        routes = np.asarray(routes)
+        tails = np.asarray(tails, dtype=float)
+        alphas = np.clip(np.asarray(alphas, dtype=float), 0, 1)
+
+        route_lengths = self.lengths[routes]
+        ends = self.ends[routes]
+        tail_lengths = np.linalg.norm(tails - ends, axis=1)
+        s = alphas * (route_lengths + tail_lengths)
+
+        result = np.empty((len(routes), 3))
+
+        on_route = s < route_lengths
+        if on_route.any():
+            r = routes[on_route]
+            offset_s = s[on_route] + r * self.stride
+            j = np.searchsorted(self.flat_cumulative, offset_s, side="right")
+            j = np.clip(j, r * self.points_per_route + 1, (r + 1) * self.points_per_route - 1)
+            s0 = self.flat_cumulative[j - 1]
+            s1 = self.flat_cumulative[j]
+            t = ((offset_s - s0) / np.maximum(s1 - s0, 1e-12))[:, None]
+            result[on_route] = (1 - t) * self.flat_points[j - 1] + t * self.flat_points[j]
+
+        on_tail = ~on_route
+        if on_tail.any():
+            t = ((s[on_tail] - route_lengths[on_tail]) / np.maximum(tail_lengths[on_tail], 1e-12))[:, None]
+            result[on_tail] = (1 - t) * ends[on_tail] + t * tails[on_tail]
+
+        return result
+
+
+def tail_point(last_vertex, items_in_stack, row_capacity=3, dot_width=0.1, dot_height=0.1, drop=2.4):
+    # Resting place of the items_in_stack-th ball in a stack, three balls per row
+    row_index = (items_in_stack - 1) // row_capacity
+    col_index = (items_in_stack - 1) % row_capacity
+
+    x = last_vertex[0]
+    if col_index == 0:
+        x = x - dot_width
+    elif col_index == 2:
+        x = x + dot_width
+    y = last_vertex[1] - drop + dot_height * row_index
+
+    return [x, y, 0]
+
+
+
+class BallScheduler:
+    # Keeps a start queue sorted by start frame and a compact list of balls in flight,
+    # so each frame only touches balls that are actually moving
+    def __init__(self, start_frames, duration_frames):
+        start_frames = np.asarray(start_frames)
+        self.order = np.argsort(start_frames, kind="stable")
+        self.sorted_starts = start_frames[self.order]
+        self.start_frames = start_frames
+        self.duration_frames = duration_frames
+        self.next_index = 0
+        self.active = np.empty(0, dtype=np.int64)
+
+    def advance(self, frame):
+        # Returns (moving indices, their alphas, indices that landed this frame)
+        launch_end = np.searchsorted(self.sorted_starts, frame, side="left")
+        if launch_end > self.next_index:
+            self.active = np.concatenate((self.active, self.order[self.next_index:launch_end]))
+            self.next_index = launch_end
+
+        alphas = (frame - self.start_frames[self.active]) / self.duration_frames
+        in_flight = alphas <= 1.0
+        landed = self.active[~in_flight]
+        self.active = self.active[in_flight]
+
+        return self.active, alphas[in_flight], landed
+
+    def finished(self):
+        return self.next_index == len(self.order) and len(self.active) == 0
+
+
+def flight_positions(paths, scheduler, routes, tails, frame):
+    # One frame of the board: (moving indices, their points, indices that landed this frame).
+    # Balls move at constant speed along route + tail, so the alphas are used as they are.
+    moving, alphas, landed = scheduler.advance(frame)
+    points = paths.positions(routes[moving], tails[moving], np.clip(alphas, 0, 1))
+    return moving, points, landed
+
+
+def stack_histogram(stack_indices, rows):
+    # Final number of balls per stack, known as soon as the routes are drawn
+    return np.bincount(np.asarray(stack_indices, dtype=np.int64), minlength=rows + 1)
+
+
+def binomial_histogram(total, rows, p=0.5):
+    # Expected balls per stack: total * C(rows, k) * p^k * (1 - p)^(rows - k)
+    k = np.arange(rows + 1)
+    coefficients = np.array([math.comb(rows, i) for i in k], dtype=float)
+    return total * coefficients * p ** k * (1 - p) ** (rows - k)
+
@@ -0,0 +1,167 @@
+import hashlib
+import json
+import math
+import shutil
+import subprocess
+from pathlib import Path
+
+from manim import *
+from manim import __version__ as manim_version
+
+from render_all import concat_videos
+
+# Bump when the look of the intro changes, so clips rendered from the old version are not reused
+INTRO_VERSION = 1
+INTRO_PLAYS = 4
+
+
+def build_intro():
+    # The "ln dy/dx" bumper: title, 8 rotating circles and 6 floating symbols
+    main_text = MathTex(r"\ln \frac{dy}{dx}", font_size=120)
+    main_text.set_color_by_gradient(BLUE_B, GREEN_B)
+
+    circles = VGroup()
+    for i in range(8):
+        circle = Circle(radius=0.5 + i * 0.3)
+        circle.set_stroke(BLUE, width=2, opacity=0.6 - i * 0.05)
+        circle.set_fill(opacity=0)
+        circles.add(circle)
+
+    floating_symbols = VGroup()
+    symbols = [r"\int", r"\sum", r"\pi", r"e", r"\infty", r"\nabla"]
+    positions = [
+        UP * 2 + LEFT * 3,
+        UP * 1.5 + RIGHT * 4,
+        DOWN * 2 + LEFT * 4,
+        DOWN * 1.5 + RIGHT * 3,
+        UP * 3 + RIGHT * 2,
+        DOWN * 3 + LEFT * 2
+    ]
+
+    for symbol, pos in zip(symbols, positions):
+        math_symbol = MathTex(symbol, font_size=60)
+        math_symbol.set_color(DARK_BLUE)
+        math_symbol.move_to(pos)
+        math_symbol.set_opacity(0.6)
+        floating_symbols.add(math_symbol)
+
+    return main_text, circles, floating_symbols
+
+
+def play_intro_live(scene, symbol_lag_ratio, circle_lag_ratio, appear_run_time, write_run_time, hold, fade_run_time):
+    main_text, circles, floating_symbols = build_intro()
+
+    scene.play(
+        LaggedStart(
+            *[FadeIn(symbol) for symbol in floating_symbols],
+            lag_ratio=symbol_lag_ratio
+        ), LaggedStart(
+            *[Create(circle) for circle in circles],
+            lag_ratio=circle_lag_ratio
+        ),
+        run_time=appear_run_time
+    )
+
+    scene.play(
+        Write(main_text),
+        Rotate(circles, angle=2*PI, about_point=ORIGIN),
+        run_time=write_run_time,
+        rate_func=linear
+    )
+    scene.wait(hold)
+    scene.play(
+        FadeOut(circles), FadeOut(floating_symbols), FadeOut(main_text),
+        run_time=fade_run_time
+    )
+
+
+def intro_cache_dir():
+    return Path(config.media_dir) / "intro_cache"
+
+
+def intro_key(scene, params):
+    # Same parameters, resolution, frame rate, encoding and background -> same clip
+    camera = scene.renderer.camera
+    description = json.dumps({
+        "version": INTRO_VERSION,
+        "manim": manim_version,
+        "params": params,
+        "pixels": [config.pixel_width, config.pixel_height],
+        "frame_rate": config.frame_rate,
+        "extension": config.movie_file_extension,
+        "transparent": config.transparent,
+        "background": hashlib.sha256(camera.background.tobytes()).hexdigest(),
+    }, sort_keys=True)
+    return hashlib.sha256(description.encode()).hexdigest()
+
+
+def partial_movie_files(file_writer):
+    if hasattr(file_writer, "sections"):
+        return [path for section in file_writer.sections for path in section.partial_movie_files]
+    return list(file_writer.partial_movie_files)
+
+
+def can_splice(scene):
+    # A clip can only stand in for the live plays when they would be written in full onto an empty frame
+    renderer = scene.renderer
+    if not hasattr(renderer, "camera") or not hasattr(renderer, "file_writer"):
+        return False
+    if not config.write_to_movie or renderer.skip_animations:
+        return False
+    # upto_animation_number is inf unless -n set an end
+    if config.from_animation_number > 0 or math.isfinite(config.upto_animation_number):
+        return False
+    return not any(mob.has_points() or mob.submobjects for mob in scene.mobjects)
+
+
+def splice_clip(scene, clip, duration):
+    # Registers the cached clip as the next partial movie file and advances manim's play
+    # counter and clock as if the intro had been played. manim indexes partial movie files
+    # by play number, so the other intro plays get None entries, like skipped animations.
+    renderer = scene.renderer
+    name = f"intro_{clip.stem[:16]}_{renderer.num_plays:05}"
+    renderer.file_writer.add_partial_movie_file(name)
+    shutil.copyfile(clip, Path(renderer.file_writer.partial_movie_directory) / f"{name}{config.movie_file_extension}")
+    renderer.animations_hashes.append(name)
+    for _ in range(INTRO_PLAYS - 1):
+        renderer.file_writer.add_partial_movie_file(None)
+        renderer.animations_hashes.append(None)
+    renderer.num_plays += INTRO_PLAYS
+    renderer.time += duration
+
+
+def store_clip(files, clip):
+    if not files or any(path is None or not Path(path).exists() for path in files):
+        return
+    if shutil.which("ffmpeg") is None:
+        logger.warning("ffmpeg not found; the intro clip is not cached")
+        return
+
+    try:
+        concat_videos(files, clip)
+    except subprocess.CalledProcessError:
+        logger.warning("ffmpeg could not join the intro clip; it is not cached")
+
+
+def play_intro(
+    scene, symbol_lag_ratio=0.2, circle_lag_ratio=0.1,
+    appear_run_time=0.8, write_run_time=1.3, hold=0.8, fade_run_time=0.8
+):
+    # Plays the intro, or splices in the clip a previous render made with the same parameters
+    params = dict(
+        symbol_lag_ratio=symbol_lag_ratio, circle_lag_ratio=circle_lag_ratio,
+        appear_run_time=appear_run_time, write_run_time=write_run_time,
+        hold=hold, fade_run_time=fade_run_time
+    )
+    if not can_splice(scene):
+        play_intro_live(scene, **params)
+        return
+
+    clip = intro_cache_dir() / f"{intro_key(scene, params)}{config.movie_file_extension}"
+    if clip.exists():
+        splice_clip(scene, clip, appear_run_time + write_run_time + hold + fade_run_time)
+        return
+
+    first = len(partial_movie_files(scene.renderer.file_writer))
+    play_intro_live(scene, **params)
+    store_clip(partial_movie_files(scene.renderer.file_writer)[first:], clip)
@@ -0,0 +1,81 @@
+from manim import *
+
+
+def coords_to_points(axes, xs, ys):
+    # axes.coords_to_point with two 1-D arrays returns one row per coordinate, (3, n);
+    # every caller here wants one row per point, (n, 3)
+    return axes.coords_to_point(np.asarray(xs, dtype=float), np.asarray(ys, dtype=float)).T
+
+
+def plot_samples(axes, xs, ys, use_smoothing=True, **kwargs):
+    # Graph from already evaluated arrays: one vectorized coords_to_point call, no per-sample Python
+    graph = VMobject(**kwargs)
+    graph.set_points_as_corners(coords_to_points(axes, xs, ys))
+    if use_smoothing:
+        graph.make_smooth()
+    return graph
+
+
+def chord_error(axes, xs, ys, mid_xs, mid_ys):
+    # Scene-space distance between each interval's true midpoint and the straight chord,
+    # worst case over all curves. Points far off screen are clamped so they never force refinement.
+    limit = config.frame_height
+    errors = np.zeros(len(mid_xs))
+    for row, mid_row in zip(ys, mid_ys):
+        points = coords_to_points(axes, xs, row)
+        mid_points = coords_to_points(axes, mid_xs, mid_row)
+        points[:, 1] = np.clip(points[:, 1], -limit, limit)
+        mid_points[:, 1] = np.clip(mid_points[:, 1], -limit, limit)
+        chord = (points[:-1] + points[1:]) / 2
+        errors = np.fmax(errors, np.linalg.norm(mid_points - chord, axis=1))
+    return errors
+
+
+def adaptive_samples(axes, function, x_range, tolerance=0.01, vectorized=False, initial_samples=33, max_depth=10):
+    # Start from a coarse grid and keep halving only the intervals whose chord misses the
+    # function by more than tolerance (scene units). function may return one curve or a
+    # (k, n) stack of curves, which then share one grid.
+    x_min, x_max = x_range[0], x_range[1]
+    if vectorized:
+        evaluate = lambda x: np.atleast_2d(function(x))
+    else:
+        evaluate = lambda x: np.atleast_2d(np.array([function(t) for t in x], dtype=float).T)
+
+    xs = np.linspace(x_min, x_max, initial_samples)
+    ys = evaluate(xs)
+
+    for _ in range(max_depth):
+        mid_xs = (xs[:-1] + xs[1:]) / 2
+        mid_ys = evaluate(mid_xs)
+        split = np.flatnonzero(chord_error(axes, xs, ys, mid_xs, mid_ys) > tolerance)
+        if len(split) == 0:
+            break
+        xs = np.insert(xs, split + 1, mid_xs[split])
+        ys = np.insert(ys, split + 1, mid_ys[:, split], axis=1)
+
+    return xs, ys
+
+
+class AdaptiveGraph(ParametricFunction):
+    # Drop-in for axes.plot(function, x_range=...): same graph attributes, adaptively sampled anchors
+    def __init__(self, axes, function, x_range, tolerance=0.01, vectorized=False, **kwargs):
+        self.axes = axes
+        self.tolerance = tolerance
+        self.vectorized = vectorized
+        self.underlying_function = function
+        self.sample_range = x_range
+        super().__init__(lambda t: axes.coords_to_point(t, function(t)), t_range=x_range[:2], **kwargs)
+
+    def generate_points(self):
+        xs, ys = adaptive_samples(
+            self.axes, self.underlying_function, self.sample_range,
+            tolerance=self.tolerance, vectorized=self.vectorized
+        )
+        self.set_points_as_corners(coords_to_points(self.axes, xs, ys[0]))
+        if self.use_smoothing:
+            self.make_smooth()
+        return self
+
+
+def adaptive_plot(axes, function, x_range, tolerance=0.01, **kwargs):
+    return AdaptiveGraph(axes, function, x_range, tolerance=tolerance, **kwargs)
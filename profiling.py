@@ -0,0 +1,239 @@
+import argparse
+import functools
+import importlib.util
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from pathlib import Path
+
+from manim import *
+from manim.camera.camera import Camera
+from manim.scene.scene_file_writer import SceneFileWriter
+from tex_cache import enable_tex_cache
+
+ROOT = Path(__file__).parent.resolve()
+QUALITIES = {"l": "low_quality", "m": "medium_quality", "h": "high_quality"}
+PROFILED_CLASSES = (
+    Text, MarkupText, SVGMobject, SingleStringMathTex, MathTex, Tex,
+    DecimalNumber, Brace, NumberPlane, Axes, ParametricFunction
+)
+CATEGORIES = ("construct", "updaters", "interpolate", "rasterize", "encode")
+
+
+def code_site(code):
+    return f"{Path(code.co_filename).name}:{code.co_firstlineno} {code.co_name}"
+
+
+class Profiler:
+    # Opt-in instrumentation: wraps Scene.play (wait() goes through it), updaters, mobject
+    # constructors, Animation.interpolate, Camera.capture_mobjects and SceneFileWriter.write_frame.
+    # Every timed call is pushed on a label stack, so the self time of each stack can be written
+    # as a collapsed-stack file, and each play() gets a summary row split by category.
+    def __init__(self, output_dir="profiles"):
+        self.output_dir = Path(output_dir)
+        self.stack = []
+        self.category_depth = defaultdict(int)
+        self.collapsed = defaultdict(float)
+        self.plays = []
+        self.current_play = None
+        self.patches = []
+        self.wrappers = {}
+        self.originals = {}
+
+    def site(self):
+        # file:line of the innermost frame in this repository, i.e. the scene line that caused the work
+        frame = sys._getframe(2)
+        while frame is not None:
+            path = frame.f_code.co_filename
+            if path.startswith(str(ROOT)) and not path.endswith("profiling.py"):
+                return f"{Path(path).name}:{frame.f_lineno}"
+            frame = frame.f_back
+        return "manim"
+
+    def measure(self, label, category, function, *args, **kwargs):
+        entry = [label, time.perf_counter(), 0.0]
+        self.stack.append(entry)
+        self.category_depth[category] += 1
+        try:
+            return function(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - entry[1]
+            self.category_depth[category] -= 1
+            self.collapsed[";".join(e[0] for e in self.stack)] += elapsed - entry[2]
+            self.stack.pop()
+            if self.stack:
+                self.stack[-1][2] += elapsed
+            # Nested calls of one category (MathTex -> SingleStringMathTex) are only counted once
+            if category and self.current_play is not None and self.category_depth[category] == 0:
+                self.current_play[category] += elapsed
+
+    def patch(self, owner, name, make_wrapper):
+        original = owner.__dict__[name]
+        self.patches.append((owner, name, original))
+        setattr(owner, name, functools.wraps(original)(make_wrapper(original)))
+
+    def wrap_updater(self, function):
+        # functools.wraps keeps the signature visible, so manim still sees "dt" parameters.
+        # One wrapper per function, remembered both ways, so remove_updater(f) and get_updaters()
+        # behave exactly as they do without profiling.
+        if function in self.originals:
+            return function
+        if function not in self.wrappers:
+            label = f"updater {code_site(function.__code__)}" if hasattr(function, "__code__") else "updater"
+
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                return self.measure(label, "updaters", function, *args, **kwargs)
+            self.wrappers[function] = wrapper
+            self.originals[wrapper] = function
+        return self.wrappers[function]
+
+    def enable(self):
+        profiler = self
+        tracemalloc.start()
+
+        def play(original):
+            def wrapper(scene, *args, **kwargs):
+                animations = [type(arg).__name__.lstrip("_") for arg in args]
+                kind = "wait" if animations == ["Wait"] else "play"
+                site = profiler.site()
+                row = dict(site=site, kind=kind, animations=" ".join(sorted(set(animations))), seconds=0.0, alloc_mb=0.0)
+                row.update({category: 0.0 for category in CATEGORIES})
+                profiler.current_play = row
+                tracemalloc.reset_peak()
+                before = tracemalloc.get_traced_memory()[0]
+                start = time.perf_counter()
+                try:
+                    return profiler.measure(f"{kind} {site}", None, original, scene, *args, **kwargs)
+                finally:
+                    row["seconds"] = time.perf_counter() - start
+                    row["alloc_mb"] = (tracemalloc.get_traced_memory()[1] - before) / 2 ** 20
+                    profiler.plays.append(row)
+                    profiler.current_play = None
+            return wrapper
+
+        def render(original):
+            def wrapper(scene, *args, **kwargs):
+                try:
+                    return original(scene, *args, **kwargs)
+                finally:
+                    profiler.write(type(scene).__name__)
+            return wrapper
+
+        def add_updater(original):
+            def wrapper(mobject, update_function, *args, **kwargs):
+                return original(mobject, profiler.wrap_updater(update_function), *args, **kwargs)
+            return wrapper
+
+        def remove_updater(original):
+            def wrapper(mobject, update_function):
+                return original(mobject, profiler.wrappers.get(update_function, update_function))
+            return wrapper
+
+        def get_updaters(original):
+            def wrapper(mobject):
+                return [profiler.originals.get(f, f) for f in original(mobject)]
+            return wrapper
+
+        def update_from_func(original):
+            def wrapper(animation, mobject, update_function, *args, **kwargs):
+                return original(animation, mobject, profiler.wrap_updater(update_function), *args, **kwargs)
+            return wrapper
+
+        def timed(label, category):
+            def make_wrapper(original):
+                def wrapper(*args, **kwargs):
+                    return profiler.measure(label, category, original, *args, **kwargs)
+                return wrapper
+            return make_wrapper
+
+        def constructor(cls):
+            def make_wrapper(original):
+                def wrapper(*args, **kwargs):
+                    return profiler.measure(f"new {cls.__name__} {profiler.site()}", "construct", original, *args, **kwargs)
+                return wrapper
+            return make_wrapper
+
+        def interpolate(original):
+            def wrapper(animation, *args, **kwargs):
+                return profiler.measure(f"interpolate {type(animation).__name__}", "interpolate", original, animation, *args, **kwargs)
+            return wrapper
+
+        self.patch(Scene, "play", play)
+        self.patch(Scene, "render", render)
+        self.patch(Mobject, "add_updater", add_updater)
+        self.patch(Mobject, "remove_updater", remove_updater)
+        self.patch(Mobject, "get_updaters", get_updaters)
+        self.patch(UpdateFromFunc, "__init__", update_from_func)
+        self.patch(Animation, "interpolate", interpolate)
+        self.patch(Camera, "capture_mobjects", timed("rasterize", "rasterize"))
+        self.patch(SceneFileWriter, "write_frame", timed("encode", "encode"))
+        for cls in PROFILED_CLASSES:
+            if "__init__" in cls.__dict__:
+                self.patch(cls, "__init__", constructor(cls))
+        return self
+
+    def disable(self):
+        for owner, name, original in reversed(self.patches):
+            setattr(owner, name, original)
+        self.patches = []
+        tracemalloc.stop()
+        return self
+
+    def summary(self):
+        # One row per (source line, animations), heaviest first; category columns are inclusive
+        rows = {}
+        for play in self.plays:
+            key = (play["site"], play["kind"], play["animations"])
+            row = rows.setdefault(key, dict(calls=0, seconds=0.0, alloc_mb=0.0, **{c: 0.0 for c in CATEGORIES}))
+            row["calls"] += 1
+            row["seconds"] += play["seconds"]
+            row["alloc_mb"] = max(row["alloc_mb"], play["alloc_mb"])
+            for category in CATEGORIES:
+                row[category] += play[category]
+
+        header = f"{'site':<32} {'animations':<36} {'calls':>5} {'total s':>8} " + " ".join(f"{c:>11}" for c in CATEGORIES) + f" {'peak MB':>8}"
+        lines = [header, "-" * len(header)]
+        for (site, kind, animations), row in sorted(rows.items(), key=lambda item: -item[1]["seconds"]):
+            name = animations if kind == "play" else "wait"
+            lines.append(
+                f"{site:<32} {name[:36]:<36} {row['calls']:>5} {row['seconds']:>8.3f} "
+                + " ".join(f"{row[c]:>11.3f}" for c in CATEGORIES) + f" {row['alloc_mb']:>8.1f}"
+            )
+        return "\n".join(lines)
+
+    def write(self, scene_name):
+        # <scene>.collapsed feeds flamegraph.pl / speedscope (weights in microseconds)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.output_dir / f"{scene_name}.collapsed", "w") as f:
+            for stack, seconds in sorted(self.collapsed.items()):
+                f.write(f"{stack} {max(1, round(seconds * 1e6))}\n")
+        (self.output_dir / f"{scene_name}.summary.txt").write_text(self.summary() + "\n")
+
+
+def enable_profiling(output_dir="profiles"):
+    return Profiler(output_dir).enable()
+
+
+if __name__ == "__main__":
+    # python profiling.py NormalDistribution.py NormalDistribution -q l
+    # flamegraph.pl profiles/NormalDistribution.collapsed > flame.svg
+    parser = argparse.ArgumentParser(description="Render one scene with profiling hooks enabled")
+    parser.add_argument("file")
+    parser.add_argument("scene")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="l")
+    parser.add_argument("--out", default="profiles")
+    args = parser.parse_args()
+
+    config.quality = QUALITIES[args.quality]
+    enable_tex_cache()
+    profiler = enable_profiling(args.out)
+
+    spec = importlib.util.spec_from_file_location(f"profiled_{Path(args.file).stem}", ROOT / args.file)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    getattr(module, args.scene)().render()
+
+    print(profiler.summary())
+    print(f"Wrote {args.out}/{args.scene}.collapsed and {args.out}/{args.scene}.summary.txt")
@@ -0,0 +1,74 @@
+from functools import lru_cache
+import numpy as np
+
+SAMPLE_TYPES = ("left", "right", "midpoint", "trapezoid")
+METHODS = SAMPLE_TYPES + ("simpson",)
+
+
+def evaluator(function, vectorized=False):
+    if vectorized:
+        return lambda x: np.asarray(function(x), dtype=float)
+    return lambda x: np.array([function(t) for t in x], dtype=float)
+
+
+def cell_count(x_range, dx):
+    return max(1, int(round((x_range[1] - x_range[0]) / dx)))
+
+
+def riemann_cells(function, x_range, dx, sample_type="right", vectorized=False):
+    # Data-space cells (x0, x1, height at x0, height at x1). Rectangles have equal heights,
+    # trapezoids take f at both edges.
+    if sample_type not in SAMPLE_TYPES:
+        raise ValueError(f"Unknown sample type: {sample_type!r}")
+    evaluate = evaluator(function, vectorized)
+
+    edges = np.linspace(x_range[0], x_range[1], cell_count(x_range, dx) + 1)
+    x0, x1 = edges[:-1], edges[1:]
+
+    if sample_type == "midpoint":
+        heights = evaluate((x0 + x1) / 2)
+        return x0, x1, heights, heights
+
+    values = evaluate(edges)
+    if sample_type == "left":
+        return x0, x1, values[:-1], values[:-1]
+    if sample_type == "right":
+        return x0, x1, values[1:], values[1:]
+    return x0, x1, values[:-1], values[1:]
+
+
+def simpson(function, x_range, count, vectorized=False):
+    # Composite Simpson's rule over an even number of intervals
+    count += count % 2
+    xs = np.linspace(x_range[0], x_range[1], count + 1)
+    ys = evaluator(function, vectorized)(xs)
+    h = (x_range[1] - x_range[0]) / count
+    return float(h / 3 * (ys[0] + ys[-1] + 4 * ys[1:-1:2].sum() + 2 * ys[2:-1:2].sum()))
+
+
+@lru_cache(maxsize=4096)
+def _cached_sum(function, x_min, x_max, count, method, vectorized):
+    x_range = (x_min, x_max)
+    if method == "simpson":
+        return simpson(function, x_range, count, vectorized)
+    x0, x1, y0, y1 = riemann_cells(function, x_range, (x_max - x_min) / count, method, vectorized)
+    return float(np.sum((x1 - x0) * (y0 + y1)) / 2)
+
+
+def riemann_sum(function, x_range, dx, method="right", vectorized=False):
+    # Cached per (function, range, number of cells), so a continuously animated dx
+    # only pays for cell counts it has not seen yet
+    if method not in METHODS:
+        raise ValueError(f"Unknown quadrature method: {method!r}")
+    return _cached_sum(function, float(x_range[0]), float(x_range[1]), cell_count(x_range, dx), method, vectorized)
+
+
+def reference_integral(function, x_range, vectorized=False, count=2 ** 14):
+    return _cached_sum(function, float(x_range[0]), float(x_range[1]), count, "simpson", vectorized)
+
+
+def sum_and_error(function, x_range, dx, method="right", reference=None, vectorized=False):
+    if reference is None:
+        reference = reference_integral(function, x_range, vectorized)
+    total = riemann_sum(function, x_range, dx, method, vectorized)
+    return total, total - reference
@@ -0,0 +1,82 @@
+from graphlib import TopologicalSorter
+from manim import *
+
+
+def bound_marker(mobject):
+    # No-op updater left on every bound mobject. manim treats everything in scene.mobjects before
+    # the first mobject with updaters as static, so without it a bound mobject added before the
+    # graph would be frozen into the cached background frame.
+    pass
+
+
+class UpdateGraph(Mobject):
+    # Mobject updaters with declared dependencies: ValueTrackers, or other mobjects bound to the
+    # same graph. Once per frame the graph checks which trackers moved and re-runs only the
+    # updaters downstream of them, in topological order. Its own updater is not time-based, so
+    # self.wait() holds stay static frames and nothing runs at all.
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.node_updaters = {}
+        self.dependencies = {}
+        self.tracker_values = {}
+        self.order = []
+        self.stale = True
+        self.add_updater(lambda m: m.refresh())
+
+    def bind(self, mobject, *dependencies, updater=None):
+        # Without an explicit updater, the mobject's own updaters are taken over by the graph
+        if updater is None:
+            updaters = [f for f in mobject.get_updaters() if f is not bound_marker]
+            mobject.clear_updaters()
+        else:
+            updaters = [updater]
+        if bound_marker not in mobject.get_updaters():
+            mobject.add_updater(bound_marker)
+        self.node_updaters[mobject] = updaters
+        self.dependencies[mobject] = dependencies
+        self.stale = True
+        return mobject
+
+    def unbind(self, *mobjects):
+        for mobject in mobjects:
+            if mobject in self.node_updaters:
+                mobject.remove_updater(bound_marker)
+            self.node_updaters.pop(mobject, None)
+            self.dependencies.pop(mobject, None)
+        self.stale = True
+        return self
+
+    def sort(self):
+        graph = {
+            mobject: [dep for dep in deps if dep in self.dependencies]
+            for mobject, deps in self.dependencies.items()
+        }
+        self.order = list(TopologicalSorter(graph).static_order())
+        self.tracker_values = {
+            dep: dep.get_value()
+            for deps in self.dependencies.values() for dep in deps
+            if isinstance(dep, ValueTracker)
+        }
+
+    def refresh(self):
+        if self.stale:
+            # New bindings: everything runs once so every node starts consistent
+            self.sort()
+            self.stale = False
+            dirty = set(self.order)
+        else:
+            dirty = set()
+            for tracker, last_value in self.tracker_values.items():
+                value = tracker.get_value()
+                if value != last_value:
+                    self.tracker_values[tracker] = value
+                    dirty.add(tracker)
+            if not dirty:
+                return self
+
+        for mobject in self.order:
+            if mobject in dirty or any(dep in dirty for dep in self.dependencies[mobject]):
+                for updater in self.node_updaters[mobject]:
+                    updater(mobject)
+                dirty.add(mobject)
+        return self
@@ -0,0 +1,173 @@
+import argparse
+import ast
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+ROOT = Path(__file__).parent
+SCENE_BASES = {"Scene", "MovingCameraScene", "ThreeDScene", "ZoomedScene"}
+QUALITY_DIRS = {"l": "480p15", "m": "720p30", "h": "1080p60", "p": "1440p60", "k": "2160p60"}
+# The numbered files 1_ .. 5_ form one continuous video
+SERIES_PATTERN = re.compile(r"^[1-5]_")
+
+
+def discover_scenes(root=ROOT):
+    # (file name, scene class) for every Scene subclass, found statically so nothing is imported
+    scenes = []
+    for path in sorted(root.glob("*.py")):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", SyntaxWarning)
+            tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef) and any(
+                isinstance(base, ast.Name) and base.id in SCENE_BASES for base in node.bases
+            ):
+                scenes.append((path.name, node.name))
+    return scenes
+
+
+def output_path(media_dir, file_name, scene, quality):
+    return Path(media_dir) / "videos" / Path(file_name).stem / QUALITY_DIRS[quality] / f"{scene}.mp4"
+
+
+def manim_command(*args):
+    # manim's CLI started through tex_cache.py, which installs the Tex cache first
+    return [sys.executable, str(ROOT / "tex_cache.py"), "manim", *args]
+
+
+def render_scene(file_name, scene, quality, media_dir):
+    # Each render is its own manim process; the pool threads only wait on them
+    command = manim_command("render", f"-q{quality}", "--media_dir", str(media_dir), file_name, scene)
+    start = time.perf_counter()
+    result = subprocess.run(command, cwd=ROOT, capture_output=True, text=True)
+    seconds = time.perf_counter() - start
+
+    output = output_path(media_dir, file_name, scene, quality)
+    entry = {
+        "file": file_name,
+        "scene": scene,
+        "seconds": round(seconds, 2),
+        "returncode": result.returncode,
+        "output": str(output) if result.returncode == 0 and output.exists() else None,
+    }
+    if result.returncode != 0:
+        entry["error"] = result.stderr[-2000:]
+    return entry
+
+
+def previous_timings(manifest_path):
+    # Longest scenes are started first, using the last manifest's timings when there is one
+    try:
+        with open(manifest_path) as f:
+            return {(e["file"], e["scene"]): e["seconds"] for e in json.load(f)["scenes"]}
+    except (OSError, ValueError, KeyError):
+        return {}
+
+
+def concat_videos(videos, target):
+    # Joins videos encoded with the same settings by stream copy. The list file and the output are
+    # written under pid-tagged names first, so parallel callers never see half-written files.
+    # Raises CalledProcessError when ffmpeg fails and FileNotFoundError when it is missing.
+    target = Path(target)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    list_file = target.with_name(f"{target.stem}.{os.getpid()}.txt")
+    tmp_target = target.with_name(f"{target.stem}.{os.getpid()}{target.suffix}")
+    list_file.write_text("".join(f"file '{Path(video).resolve()}'\n" for video in videos))
+    try:
+        subprocess.run(
+            ["ffmpeg", "-y", "-loglevel", "error", "-f", "concat", "-safe", "0", "-i", str(list_file), "-c", "copy", str(tmp_target)],
+            check=True
+        )
+        os.replace(tmp_target, target)
+    finally:
+        list_file.unlink(missing_ok=True)
+        tmp_target.unlink(missing_ok=True)
+    return str(target)
+
+
+def concat_series(entries, target):
+    # A series with a failed chapter is not joined at all, rather than silently skipping it
+    series = [e for e in entries if SERIES_PATTERN.match(e["file"])]
+    missing = [f"{e['file']}:{e['scene']}" for e in series if not e["output"]]
+    if missing:
+        raise RuntimeError(f"series scenes did not render: {', '.join(missing)}")
+    if not series:
+        return None
+    return concat_videos([e["output"] for e in series], target)
+
+
+def render_all(scenes, quality="h", workers=None, media_dir="media", manifest_path=None, series_target=None):
+    workers = workers or os.cpu_count() or 1
+    manifest_path = manifest_path or Path(media_dir) / "render_manifest.json"
+    timings = previous_timings(manifest_path)
+    queue = sorted(scenes, key=lambda scene: -timings.get(scene, 0))
+
+    start = time.perf_counter()
+    results = {}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(render_scene, *scene, quality, media_dir): scene for scene in queue}
+        for future in as_completed(futures):
+            entry = future.result()
+            results[futures[future]] = entry
+            status = "ok" if entry["output"] else f"failed ({entry['returncode']})"
+            print(f"{entry['file']}:{entry['scene']} {status} in {entry['seconds']}s")
+
+    # Manifest entries keep discovery order, which is also the series order
+    entries = [results[scene] for scene in scenes]
+    manifest = {
+        "quality": quality,
+        "workers": workers,
+        "wall_seconds": round(time.perf_counter() - start, 2),
+        "scenes": entries,
+        "series": None,
+    }
+    if series_target:
+        # A failed join must not cost the manifest of every scene that did render
+        try:
+            manifest["series"] = concat_series(entries, series_target)
+        except (subprocess.CalledProcessError, OSError, RuntimeError) as error:
+            manifest["series_error"] = str(error)
+
+    Path(manifest_path).parent.mkdir(parents=True, exist_ok=True)
+    with open(manifest_path, "w") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+if __name__ == "__main__":
+    # python render_all.py                          -> every scene, -qh, one worker per core
+    # python render_all.py -q l --only Limit Integral
+    # python render_all.py --series media/series.mp4
+    parser = argparse.ArgumentParser(description="Render every scene in parallel and write a manifest")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITY_DIRS), default="h")
+    parser.add_argument("-j", "--workers", type=int, default=None)
+    parser.add_argument("--only", nargs="*", default=None, help="substrings of file or scene names to render")
+    parser.add_argument("--media-dir", default="media")
+    parser.add_argument("--manifest", default=None)
+    parser.add_argument("--series", default=None, help="also concatenate the 1_ .. 5_ scenes into this file")
+    parser.add_argument("--no-warm", action="store_true", help="skip pre-compiling the Tex cache")
+    args = parser.parse_args()
+
+    scenes = discover_scenes()
+    if args.only:
+        scenes = [s for s in scenes if any(pattern in s[0] or pattern in s[1] for pattern in args.only)]
+
+    if not args.no_warm:
+        # Compile every literal Tex string once, up front, so parallel renders never race on LaTeX
+        subprocess.run(
+            [sys.executable, "tex_cache.py", "warm", "--media-dir", args.media_dir, *sorted({s[0] for s in scenes})],
+            cwd=ROOT, check=False
+        )
+
+    manifest = render_all(scenes, args.quality, args.workers, args.media_dir, args.manifest, args.series)
+    failed = [e for e in manifest["scenes"] if not e["output"]]
+    print(f"{len(manifest['scenes']) - len(failed)} of {len(manifest['scenes'])} scenes rendered in {manifest['wall_seconds']}s")
+    if "series_error" in manifest:
+        print(f"Series not written: {manifest['series_error']}")
+    sys.exit(1 if failed or "series_error" in manifest else 0)
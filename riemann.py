@@ -0,0 +1,81 @@
+from manim import *
+from plotting import coords_to_points
+from quadrature import riemann_cells
+
+
+def repeat_cells(cells, slots):
+    # Spreads n cells over slots >= n entries, each cell repeated over a contiguous run,
+    # the same way Transform duplicates submobjects when counts differ
+    count = len(cells[0])
+    index = (np.arange(slots) * count) // slots
+    return tuple(values[index] for values in cells)
+
+
+class RiemannSum(VMobject):
+    # A whole Riemann sum as one VMobject: every rectangle is a subpath of one point array,
+    # built from the sampled function in a single NumPy pass
+    def __init__(
+        self, axes, function, x_range, dx, sample_type="right", vectorized=False,
+        color=(BLUE, GREEN), fill_opacity=1, stroke_width=1, stroke_color=BLACK, **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.axes = axes
+        self.function = function
+        self.x_range = x_range
+        self.dx = dx
+        self.sample_type = sample_type
+        self.vectorized = vectorized
+        self.max_stroke_width = stroke_width
+        self.outline_color = stroke_color
+
+        self.set_fill(color, opacity=fill_opacity)
+        self.set_sheen_direction(RIGHT)
+        self.set_cells(riemann_cells(function, x_range, dx, sample_type, vectorized))
+
+    def set_cells(self, cells, slots=None):
+        self.cells = cells
+        self.cell_count = len(cells[0])
+        x0, x1, y0, y1 = repeat_cells(cells, slots) if slots else cells
+        zeros = np.zeros_like(x0)
+
+        xs = np.stack((x0, x0, x1, x1, x0), axis=1)
+        ys = np.stack((zeros, y0, y1, zeros, zeros), axis=1)
+        corners = coords_to_points(self.axes, xs.ravel(), ys.ravel()).reshape(-1, 5, 3)
+
+        # Each edge is a straight cubic: anchor, two handles at thirds, anchor
+        starts = corners[:, :-1, None]
+        ends = corners[:, 1:, None]
+        thirds = np.linspace(0, 1, 4)[:, None]
+        self.set_points((starts + (ends - starts) * thirds).reshape(-1, 3))
+
+        # Thin the outlines once cells get narrower than the strokes between them
+        cell_width = np.min(corners[:, 3, 0] - corners[:, 0, 0])
+        self.set_stroke(self.outline_color, width=min(self.max_stroke_width, 25 * cell_width))
+        return self
+
+    def with_dx(self, dx, sample_type=None):
+        return RiemannSum(
+            self.axes, self.function, self.x_range, dx,
+            sample_type=sample_type or self.sample_type, vectorized=self.vectorized,
+            color=self.get_fill_colors(), fill_opacity=self.get_fill_opacity(),
+            stroke_width=self.max_stroke_width, stroke_color=self.outline_color
+        )
+
+
+class RiemannTransform(Transform):
+    # Changes dx (or sample type) by interpolating corners inside one point array:
+    # both sums are laid out over the larger cell count first, so no submobject matching is needed
+    def __init__(self, riemann, target, **kwargs):
+        slots = max(riemann.cell_count, target.cell_count)
+        riemann.set_cells(riemann.cells, slots)
+        target.set_cells(target.cells, slots)
+        self.target_sum = target
+        super().__init__(riemann, target, **kwargs)
+
+    def finish(self):
+        super().finish()
+        target = self.target_sum
+        self.mobject.cells = target.cells
+        self.mobject.cell_count = target.cell_count
+        self.mobject.dx = target.dx
+        self.mobject.sample_type = target.sample_type
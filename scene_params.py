@@ -0,0 +1,11 @@
+import json
+import os
+
+PARAMS_ENV_VAR = "DY_MANIM_PARAMS"
+
+
+def scene_param(name, default):
+    # Overrides from $DY_MANIM_PARAMS (a JSON object), e.g. '{"total_agents": 2000}'; used by
+    # benchmark.py for scaling runs. Without the variable every scene keeps its own default.
+    params = json.loads(os.environ.get(PARAMS_ENV_VAR) or "{}")
+    return type(default)(params[name]) if name in params else default
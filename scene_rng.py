@@ -0,0 +1,21 @@
+import os
+import numpy as np
+
+DEFAULT_SEED = 0
+SEED_ENV_VAR = "DY_MANIM_SEED"
+
+
+def resolve_seed(scene=None, seed=None):
+    # Explicit seed, then Scene(random_seed=...), then $DY_MANIM_SEED, then DEFAULT_SEED
+    if seed is None and scene is not None:
+        seed = getattr(scene, "random_seed", None)
+    if seed is None:
+        seed = os.environ.get(SEED_ENV_VAR)
+    if seed is None:
+        seed = DEFAULT_SEED
+    return int(seed)
+
+
+def scene_rng(scene=None, seed=None):
+    # Every stochastic scene draws from one seeded Generator, so identical inputs give identical frames
+    return np.random.default_rng(resolve_seed(scene, seed))
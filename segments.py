@@ -0,0 +1,123 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from render_all import ROOT, QUALITY_DIRS, concat_videos, manim_command, output_path
+
+SEGMENTS_ENV = "DY_MANIM_SEGMENTS"
+
+
+def mark_segment(scene, name):
+    # Declares that an independently renderable segment starts at the scene's next play()/wait().
+    # Outside a planning run this only costs an environment lookup.
+    path = os.environ.get(SEGMENTS_ENV)
+    if path:
+        mark = {"scene": type(scene).__name__, "name": name, "play": scene.renderer.num_plays}
+        with open(path, "a") as f:
+            f.write(json.dumps(mark) + "\n")
+
+
+def plan_segments(file_name, scene, media_dir="media"):
+    # One fast skipped run (-s renders no frames) collects the play index of every mark.
+    # It also compiles all of the scene's LaTeX once, before the workers start.
+    with tempfile.TemporaryDirectory() as tmp:
+        marks_file = Path(tmp) / "marks.jsonl"
+        subprocess.run(
+            manim_command("render", "-ql", "-s", "--media_dir", str(media_dir), file_name, scene),
+            cwd=ROOT, env=dict(os.environ, **{SEGMENTS_ENV: str(marks_file)}),
+            capture_output=True, check=True
+        )
+        marks = [json.loads(line) for line in marks_file.read_text().splitlines()] if marks_file.exists() else []
+
+    names = {0: "start"}
+    for mark in marks:
+        if mark["scene"] == scene:
+            names[mark["play"]] = mark["name"]
+    starts = sorted(names)
+    ends = [start - 1 for start in starts[1:]] + [None]
+    return [{"name": names[start], "first": start, "last": end} for start, end in zip(starts, ends)]
+
+
+def render_segment(file_name, scene, quality, media_dir, index, segment):
+    # manim replays construct() and skips every animation before segment["first"], so the
+    # segment starts from exactly the mobject state the serial render would have there
+    output_name = f"{scene}_segment_{index:02d}"
+    span = f"{segment['first']},{segment['last']}" if segment["last"] is not None else str(segment["first"])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Own partial movie directory, so workers never share manim's partial file list
+        config_file = Path(tmp) / "segment.cfg"
+        config_file.write_text(f"[CLI]\npartial_movie_dir = {{video_dir}}/partial_movie_files/{output_name}\n")
+        command = manim_command(
+            "render", f"-q{quality}", "--media_dir", str(media_dir),
+            "--config_file", str(config_file), "-n", span, "-o", output_name, file_name, scene
+        )
+        start = time.perf_counter()
+        result = subprocess.run(command, cwd=ROOT, capture_output=True, text=True)
+
+    output = output_path(media_dir, file_name, output_name, quality)
+    return dict(
+        segment,
+        seconds=round(time.perf_counter() - start, 2),
+        returncode=result.returncode,
+        output=str(output) if result.returncode == 0 and output.exists() else None,
+        error=result.stderr[-2000:] if result.returncode else None
+    )
+
+
+def render_in_segments(file_name, scene, quality="h", workers=None, media_dir="media"):
+    start = time.perf_counter()
+    segments = plan_segments(file_name, scene, media_dir)
+    workers = min(workers or os.cpu_count() or 1, len(segments))
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(
+            lambda item: render_segment(file_name, scene, quality, media_dir, *item), enumerate(segments)
+        ))
+
+    target = output_path(media_dir, file_name, scene, quality)
+    failed = [r for r in results if not r["output"]]
+    report = {
+        "file": file_name,
+        "scene": scene,
+        "quality": quality,
+        "workers": workers,
+        "segments": results,
+        "output": None,
+    }
+    if not failed:
+        # Every segment is encoded with the same settings, so stream copy joins them losslessly
+        try:
+            report["output"] = concat_videos([r["output"] for r in results], target)
+        except (subprocess.CalledProcessError, OSError) as error:
+            report["error"] = str(error)
+    report["wall_seconds"] = round(time.perf_counter() - start, 2)
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with open(target.with_name(f"{scene}_segments.json"), "w") as f:
+        json.dump(report, f, indent=2)
+    return report
+
+
+if __name__ == "__main__":
+    # python segments.py NormalDistribution.py NormalDistribution -q h -j 4
+    parser = argparse.ArgumentParser(description="Render one scene as parallel segments and stitch them together")
+    parser.add_argument("file")
+    parser.add_argument("scene")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITY_DIRS), default="h")
+    parser.add_argument("-j", "--workers", type=int, default=None)
+    parser.add_argument("--media-dir", default="media")
+    args = parser.parse_args()
+
+    report = render_in_segments(args.file, args.scene, args.quality, args.workers, args.media_dir)
+    for segment in report["segments"]:
+        status = "ok" if segment["output"] else f"failed ({segment['returncode']})"
+        print(f"{segment['name']}: plays {segment['first']}..{segment['last'] if segment['last'] is not None else 'end'} {status} in {segment['seconds']}s")
+    print(f"{report['output'] or 'not stitched'} in {report['wall_seconds']}s")
+    sys.exit(0 if report["output"] else 1)
@@ -0,0 +1,46 @@
+import math
+import numpy as np
+
+# n-th term (n = 0, 1, 2, ...) of each series as (power of x, coefficient)
+SERIES_TERMS = {
+    "sin": lambda n: (2 * n + 1, (-1) ** n / math.factorial(2 * n + 1)),
+    "cos": lambda n: (2 * n, (-1) ** n / math.factorial(2 * n)),
+    "exp": lambda n: (n, 1 / math.factorial(n)),
+    "log1p": lambda n: (n + 1, (-1) ** n / (n + 1)),
+    "geometric": lambda n: (n, 1.0),
+    "gaussian": lambda n: (2 * n, (-1) ** n / math.factorial(n)),
+}
+
+
+class PartialSumCache:
+    # All partial sums of one series on one sample grid: row k - 1 is the k-term approximation.
+    # Term k is evaluated once and added to the previous row, so N approximations cost N terms;
+    # this replaces evaluating every approximation separately as a Horner polynomial.
+    def __init__(self, name, x):
+        self.name = name
+        self.x = np.asarray(x, dtype=float)
+        self.sums = np.empty((0, len(self.x)))
+        self.power = 0
+        self.x_power = np.ones_like(self.x)
+
+    def extend(self, n_terms):
+        if n_terms <= len(self.sums):
+            return self
+        rows = [self.sums]
+        last = self.sums[-1] if len(self.sums) else np.zeros_like(self.x)
+        for n in range(len(self.sums), n_terms):
+            power, coefficient = SERIES_TERMS[self.name](n)
+            # Successive terms only ever raise the power, so keep a running x**power
+            self.x_power = self.x_power * self.x ** (power - self.power)
+            self.power = power
+            last = last + coefficient * self.x_power
+            rows.append(last[None, :])
+        self.sums = np.concatenate(rows)
+        return self
+
+    def partial_sums(self, n_terms):
+        # (n_terms, n_samples) array of the 1..n_terms approximations
+        return self.extend(n_terms).sums[:n_terms]
+
+    def __getitem__(self, n_terms):
+        return self.extend(n_terms).sums[n_terms - 1]
@@ -0,0 +1,22 @@
+from benchmark import compare
+
+
+def make_run(seconds, frames=90, play_count=3, params=None):
+    return {
+        "scene": "LimitVisualization", "params": params or {}, "returncode": 0,
+        "total_seconds": seconds, "peak_rss_mb": 200.0, "frames": frames, "play_count": play_count,
+    }
+
+
+def test_compare_flags_slower_run_with_the_same_workload():
+    regressions, mismatched = compare([make_run(2.0)], {"runs": [make_run(1.0)]}, 0.15)
+    assert [metric for _, metric, _, _ in regressions] == ["total_seconds"]
+    assert mismatched == []
+
+
+def test_compare_refuses_runs_whose_frames_or_plays_changed():
+    baseline = {"runs": [make_run(1.0), make_run(1.0, params={"final_dx": 0.01})]}
+    runs = [make_run(2.0, frames=180), make_run(2.0, play_count=4, params={"final_dx": 0.01})]
+    regressions, mismatched = compare(runs, baseline, 0.15)
+    assert regressions == []
+    assert [(old, new) for _, old, new in mismatched] == [((90, 3), (180, 3)), ((90, 3), (90, 4))]
@@ -0,0 +1,45 @@
+import numpy as np
+
+from galton import BallScheduler, GaltonPaths, flight_positions, tail_point
+
+
+def board(rows=4):
+    vertices = [[np.array([col - row / 2, -row, 0.0]) for col in range(row + 1)] for row in range(rows + 1)]
+    return GaltonPaths(vertices, [0, 1, 0], rows=rows), vertices
+
+
+def test_flight_positions_with_several_balls_in_flight():
+    rows = 4
+    paths, vertices = board(rows)
+    routes = np.arange(6) % paths.route_count
+    tails = np.array([tail_point(vertices[rows][0], k + 1) for k in range(6)], dtype=float)
+    scheduler = BallScheduler([1, 2, 3, 4, 5, 6], duration_frames=10)
+
+    in_flight = []
+    landed_total = 0
+    for frame in range(1, 20):
+        moving, points, landed = flight_positions(paths, scheduler, routes, tails, frame)
+        assert points.shape == (len(moving), 3)
+        in_flight.append(len(moving))
+        landed_total += len(landed)
+
+    assert max(in_flight) > 1
+    assert landed_total == 6
+    assert scheduler.finished()
+
+
+def test_flight_positions_follow_route_then_tail():
+    rows = 4
+    paths, vertices = board(rows)
+    routes = np.array([0, 3])
+    tails = np.array([tail_point(vertices[rows][0], 1), tail_point(vertices[rows][2], 1)], dtype=float)
+    scheduler = BallScheduler([1, 1], duration_frames=10)
+
+    # Balls launch on the frame after their start frame
+    moving, _, _ = flight_positions(paths, scheduler, routes, tails, 1)
+    assert len(moving) == 0
+    moving, early, _ = flight_positions(paths, scheduler, routes, tails, 2)
+    assert len(moving) == 2
+    assert np.all(early[:, 1] < 1) and np.all(early[:, 1] > vertices[rows][0][1])
+    moving, end, _ = flight_positions(paths, scheduler, routes, tails, 11)
+    assert np.allclose(end, tails[moving])
@@ -0,0 +1,38 @@
+import pytest
+
+pytest.importorskip("manim")
+
+from manim import Scene, tempconfig
+
+from intro import INTRO_PLAYS, can_splice, partial_movie_files, splice_clip
+
+
+@pytest.fixture
+def movie_config(tmp_path):
+    with tempconfig({"media_dir": str(tmp_path), "write_to_movie": True, "disable_caching": True}):
+        yield tmp_path
+
+
+def test_default_config_can_splice(movie_config):
+    assert can_splice(Scene())
+
+
+def test_animation_range_cannot_splice(movie_config):
+    with tempconfig({"from_animation_number": 2}):
+        assert not can_splice(Scene())
+    with tempconfig({"upto_animation_number": 3}):
+        assert not can_splice(Scene())
+
+
+def test_splice_keeps_files_in_step_with_plays(movie_config):
+    scene = Scene()
+    clip = movie_config / "intro.mp4"
+    clip.write_bytes(b"")
+
+    splice_clip(scene, clip, 3.7)
+
+    files = partial_movie_files(scene.renderer.file_writer)
+    assert scene.renderer.num_plays == INTRO_PLAYS
+    assert len(files) == INTRO_PLAYS
+    assert files[0] is not None and files[1:] == [None] * (INTRO_PLAYS - 1)
+    assert scene.renderer.time == pytest.approx(3.7)
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+from manim import Axes
+
+from plotting import adaptive_plot, adaptive_samples, coords_to_points, plot_samples
+
+
+@pytest.fixture
+def axes():
+    return Axes(x_range=[-6, 6, 1], y_range=[-4, 4, 1], x_length=12, y_length=8)
+
+
+def test_coords_to_points_is_one_row_per_point(axes):
+    xs = np.array([-1.0, 0.0, 2.0])
+    ys = np.array([0.5, 1.0, -2.0])
+    points = coords_to_points(axes, xs, ys)
+    assert points.shape == (3, 3)
+    for point, x, y in zip(points, xs, ys):
+        assert np.allclose(point, axes.coords_to_point(x, y))
+
+
+def test_adaptive_samples_refines_and_stacks_curves(axes):
+    xs, ys = adaptive_samples(axes, lambda x: np.vstack((np.sin(x), np.cos(x))), [-6, 6], vectorized=True)
+    assert ys.shape == (2, len(xs))
+    assert len(xs) > 33
+    assert np.all(np.diff(xs) > 0)
+    assert np.allclose(ys[0], np.sin(xs))
+
+
+def test_adaptive_plot_follows_the_function(axes):
+    graph = adaptive_plot(axes, np.sin, [-6, 6])
+    anchors = graph.get_anchors()
+    coords = np.array([axes.point_to_coords(point) for point in anchors])
+    assert np.allclose(coords[:, 1], np.sin(coords[:, 0]), atol=0.05)
+    assert np.isclose(coords[0, 0], -6) and np.isclose(coords[-1, 0], 6)
+
+def test_plot_samples_puts_corners_on_the_samples(axes):
+    xs = np.linspace(-2, 2, 9)
+    graph = plot_samples(axes, xs, xs ** 2, use_smoothing=False)
+    assert np.allclose(graph.get_start(), axes.coords_to_point(-2, 4))
+    assert np.allclose(graph.get_end(), axes.coords_to_point(2, 4))
+
@@ -0,0 +1,22 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+from manim import DL, UR, Axes
+
+from riemann import RiemannSum
+
+
+@pytest.mark.parametrize("sample_type", ["left", "right"])
+def test_corners_match_get_riemann_rectangles(sample_type):
+    axes = Axes(x_range=[0, 3, 1], y_range=[0, 9, 3], x_length=6, y_length=5)
+    function = lambda x: x ** 2
+    riemann = RiemannSum(axes, function, [0, 3], 0.5, sample_type=sample_type)
+    reference = axes.get_riemann_rectangles(axes.plot(function), x_range=[0, 3], dx=0.5, input_sample_type=sample_type)
+
+    cells = riemann.points.reshape(len(reference), -1, 3)
+    for cell, rectangle in zip(cells, reference):
+        assert np.allclose(cell.min(axis=0)[:2], rectangle.get_corner(DL)[:2], atol=1e-6)
+        assert np.allclose(cell.max(axis=0)[:2], rectangle.get_corner(UR)[:2], atol=1e-6)
+    assert riemann.get_stroke_width() > 0
@@ -0,0 +1,50 @@
+import shutil
+
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+if shutil.which("latex") is None:
+    pytest.skip("needs a LaTeX installation", allow_module_level=True)
+
+from manim import MathTex
+from manim.mobject.svg.svg_mobject import SVG_HASH_TO_MOB_MAP
+
+import tex_cache
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setenv(tex_cache.CACHE_DIR_ENV, str(tmp_path))
+    SVG_HASH_TO_MOB_MAP.clear()
+    tex_cache.enable_tex_cache()
+    yield tmp_path
+    tex_cache.disable_tex_cache()
+    SVG_HASH_TO_MOB_MAP.clear()
+
+
+def build():
+    return MathTex(r"\frac{dy}{dx}", "=", r"\lim_{h \to 0}")
+
+
+def test_warm_entry_rebuilds_mathtex_parts(cache, monkeypatch):
+    cold = build()
+    assert list(cache.glob("*.npz"))
+
+    # Drop manim's in-memory cache so the second build has to load the entry from disk,
+    # and make sure it does so without compiling the LaTeX again
+    def no_compile(*args, **kwargs):
+        raise AssertionError("tex_to_svg_file compiled a cached expression")
+
+    monkeypatch.setattr(tex_cache, "_original_tex_to_svg_file", no_compile)
+    SVG_HASH_TO_MOB_MAP.clear()
+    warm = build()
+
+    assert len(warm) == len(cold) == 3
+    for cold_part, warm_part in zip(cold, warm):
+        assert len(warm_part) == len(cold_part)
+        assert np.allclose(warm_part.get_all_points(), cold_part.get_all_points())
+
+    # The copy kept in manim's in-memory cache must split up the same way
+    again = build()
+    assert [len(part) for part in again] == [len(part) for part in cold]
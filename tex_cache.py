@@ -0,0 +1,219 @@
+import argparse
+import ast
+import hashlib
+import os
+import shutil
+import sys
+import warnings
+from pathlib import Path
+
+import numpy as np
+from manim import *
+from manim import __version__ as manim_version
+from manim.mobject.svg.svg_mobject import SVG_HASH_TO_MOB_MAP
+from manim.mobject.text import tex_mobject
+from manim.utils.iterables import hash_obj
+from manim.utils.tex_file_writing import generate_tex_file
+
+# Parsed Tex/MathTex path data, stored on disk so every scene and process can skip both the
+# LaTeX -> SVG compile and the SVG parsing. Entries are keyed on the tex expression, environment
+# and template, so a hit never needs the compiled .svg at all.
+CACHE_DIR_ENV = "DY_MANIM_TEX_CACHE"
+TEX_CLASSES = ("MathTex", "Tex", "SingleStringMathTex")
+WARM_KEYWORDS = ("tex_environment", "arg_separator")
+# Bump when the entry layout changes, so older entries are rebuilt instead of misread
+CACHE_FORMAT = 3
+
+_original_init_svg_mobject = SVGMobject.init_svg_mobject
+_original_tex_to_svg_file = tex_mobject.tex_to_svg_file
+
+
+def cache_dir():
+    path = os.environ.get(CACHE_DIR_ENV)
+    if path is None:
+        path = Path(config.media_dir) / "tex_path_cache"
+    return Path(path)
+
+
+def tex_key(expression, environment, tex_template):
+    # Everything LaTeX sees: the expression, its environment and the full template body
+    template = tex_template if tex_template is not None else config.tex_template
+    parts = (str(CACHE_FORMAT), manim_version, expression, str(environment), getattr(template, "body", repr(template)))
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+def cache_key(mob):
+    # tex key plus the settings the SVG is parsed with
+    parse = hashlib.sha256(f"{mob.__class__.__name__}|{mob.svg_default!r}|{mob.path_string_config!r}".encode())
+    expression = mob._get_modified_expression(mob.tex_string)
+    return f"{tex_key(expression, mob.tex_environment, mob.tex_template)}_{parse.hexdigest()[:16]}"
+
+
+def cached_tex_to_svg_file(expression, environment=None, tex_template=None):
+    # On a hit only the small .tex file is written, for manim's file name; LaTeX and dvisvgm never run
+    if any(cache_dir().glob(f"{tex_key(expression, environment, tex_template)}_*.npz")):
+        template = tex_template if tex_template is not None else config.tex_template
+        return generate_tex_file(expression, environment, template).with_suffix(".svg")
+    return _original_tex_to_svg_file(expression, environment=environment, tex_template=tex_template)
+
+
+def save_entry(path, submobjects, id_to_vgroup_dict):
+    arrays = {}
+    for i, sub in enumerate(submobjects):
+        if sub.submobjects:
+            return
+        arrays[f"points_{i}"] = sub.points
+        arrays[f"fill_{i}"] = sub.fill_rgbas
+        arrays[f"stroke_{i}"] = sub.stroke_rgbas
+        arrays[f"width_{i}"] = np.array([sub.stroke_width])
+
+    # MathTex splits itself into parts through id_to_vgroup_dict, so every svg id is
+    # stored as the indices of the path submobjects it groups
+    index = {id(sub): i for i, sub in enumerate(submobjects)}
+    names = list(id_to_vgroup_dict)
+    for j, name in enumerate(names):
+        members = id_to_vgroup_dict[name].family_members_with_points()
+        arrays[f"group_{j}"] = np.array([index[id(mob)] for mob in members if id(mob) in index], dtype=int)
+    arrays["group_names"] = np.array(names, dtype=str)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write then rename, so parallel renders never read a half-written entry
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        np.savez(f, count=np.array([len(submobjects)]), **arrays)
+    os.replace(tmp_path, path)
+
+
+def load_entry(path):
+    submobjects = []
+    with np.load(path) as data:
+        for i in range(int(data["count"][0])):
+            sub = VMobject()
+            sub.set_points(data[f"points_{i}"])
+            sub.fill_rgbas = data[f"fill_{i}"]
+            sub.stroke_rgbas = data[f"stroke_{i}"]
+            sub.stroke_width = float(data[f"width_{i}"][0])
+            submobjects.append(sub)
+        id_to_vgroup_dict = {
+            str(name): VGroup(*[submobjects[i] for i in data[f"group_{j}"]])
+            for j, name in enumerate(data["group_names"])
+        }
+    return submobjects, id_to_vgroup_dict
+
+
+def cached_init_svg_mobject(self, use_svg_cache=True):
+    if not use_svg_cache or not isinstance(self, SingleStringMathTex):
+        return _original_init_svg_mobject(self, use_svg_cache)
+
+    hash_val = hash_obj(self.hash_seed)
+    if hash_val in SVG_HASH_TO_MOB_MAP:
+        return _original_init_svg_mobject(self, use_svg_cache)
+
+    path = cache_dir() / f"{cache_key(self)}.npz"
+    if path.exists():
+        try:
+            submobjects, id_to_vgroup_dict = load_entry(path)
+            self.add(*submobjects)
+            self.id_to_vgroup_dict = id_to_vgroup_dict
+            # copy() is a deepcopy, so the stored copy's dict points at the copy's own paths
+            SVG_HASH_TO_MOB_MAP[hash_val] = self.copy()
+            return
+        except Exception:
+            logger.warning(f"Ignoring unreadable tex cache entry {path}")
+
+    if not Path(self.file_name).exists():
+        # The compile was skipped for an entry parsed with other settings; compile it now
+        _original_tex_to_svg_file(
+            self._get_modified_expression(self.tex_string),
+            environment=self.tex_environment, tex_template=self.tex_template
+        )
+    _original_init_svg_mobject(self, use_svg_cache)
+    save_entry(path, self.submobjects, getattr(self, "id_to_vgroup_dict", {}))
+
+
+def enable_tex_cache():
+    tex_mobject.tex_to_svg_file = cached_tex_to_svg_file
+    SVGMobject.init_svg_mobject = cached_init_svg_mobject
+
+
+def disable_tex_cache():
+    tex_mobject.tex_to_svg_file = _original_tex_to_svg_file
+    SVGMobject.init_svg_mobject = _original_init_svg_mobject
+
+
+def run_manim(args):
+    # The one place scenes get the cache: render_all, segments and `python tex_cache.py manim ...`
+    # start manim's own CLI through here, so scene files never install it themselves
+    from manim.__main__ import main
+
+    enable_tex_cache()
+    main(args=args, prog_name="manim")
+
+
+def find_tex_calls(path):
+    # Literal MathTex/Tex calls in a scene file: (class name, string args, literal keyword args).
+    # f-strings and computed arguments cannot be known statically and are skipped.
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", SyntaxWarning)
+        tree = ast.parse(Path(path).read_text(encoding="utf-8"), filename=str(path))
+
+    calls = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call) or not isinstance(node.func, ast.Name):
+            continue
+        if node.func.id not in TEX_CLASSES or not node.args:
+            continue
+        if not all(isinstance(arg, ast.Constant) and isinstance(arg.value, str) for arg in node.args):
+            continue
+        kwargs = {
+            kw.arg: kw.value.value for kw in node.keywords
+            if kw.arg in WARM_KEYWORDS and isinstance(kw.value, ast.Constant)
+        }
+        calls.append((node.func.id, tuple(arg.value for arg in node.args), tuple(sorted(kwargs.items()))))
+    return calls
+
+
+def warm(paths):
+    enable_tex_cache()
+    classes = {"MathTex": MathTex, "Tex": Tex, "SingleStringMathTex": SingleStringMathTex}
+
+    calls = []
+    for path in paths:
+        calls.extend(find_tex_calls(path))
+    calls = list(dict.fromkeys(calls))
+
+    failed = 0
+    for name, args, kwargs in calls:
+        try:
+            classes[name](*args, **dict(kwargs))
+        except Exception as error:
+            failed += 1
+            logger.warning(f"Could not warm {name}{args}: {error}")
+
+    print(f"Warmed {len(calls) - failed} of {len(calls)} tex expressions into {cache_dir()}")
+
+
+if __name__ == "__main__":
+    # python tex_cache.py warm            -> scan every scene file next to this one
+    # python tex_cache.py warm Foo.py     -> scan only the given files
+    # python tex_cache.py clear
+    # python tex_cache.py manim render -pqh Foo.py Scene   -> manim's CLI with the cache installed
+    if sys.argv[1:2] == ["manim"]:
+        run_manim(sys.argv[2:])
+        sys.exit(0)
+
+    parser = argparse.ArgumentParser(description="Persistent cache of parsed Tex/MathTex path data")
+    parser.add_argument("command", choices=["warm", "clear"])
+    parser.add_argument("files", nargs="*")
+    parser.add_argument("--media-dir", default=None, help="same as manim's --media_dir; the cache lives under it")
+    args = parser.parse_args()
+    if args.media_dir:
+        config.media_dir = args.media_dir
+
+    if args.command == "clear":
+        shutil.rmtree(cache_dir(), ignore_errors=True)
+        print(f"Removed {cache_dir()}")
+        sys.exit(0)
+
+    files = args.files or sorted(str(p) for p in Path(__file__).parent.glob("*.py"))
+    warm(files)
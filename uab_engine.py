@@ -0,0 +1,262 @@
+import argparse
+import numpy as np
+from scene_rng import DEFAULT_SEED
+
+# Agent states, stored as small ints so every rule runs on whole arrays
+UNAWARE, AWARE, BORED = 0, 1, 2
+STATE_NAMES = ("unaware", "aware", "bored")
+DEFAULT_BOUNDS = (-6.5, -1, -2, 2)
+
+
+class UABEngine:
+    def __init__(
+        self,
+        total_agents,
+        bounds,
+        speed=0.04,
+        share_radius=0.15,
+        sharing_rate=0.08,
+        ignore_rate=0.05,
+        initial_aware=5,
+        bored_after=40,
+        margin=0.2,
+        contact_method="grid",
+        rng=None,
+    ):
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.total_agents = total_agents
+        self.share_radius = share_radius
+        self.sharing_rate = sharing_rate
+        self.ignore_rate = ignore_rate
+        self.bored_after = bored_after
+        self.contact_method = contact_method
+
+        # bounds = (left, right, bottom, top)
+        left, right, bottom, top = bounds
+        self.lower = np.array([left, bottom], dtype=float)
+        self.upper = np.array([right, top], dtype=float)
+
+        self.positions = np.column_stack((
+            self.rng.uniform(left + margin, right - margin, total_agents),
+            self.rng.uniform(bottom + margin, top - margin, total_agents),
+        ))
+        self.velocities = self.rng.uniform(-speed, speed, (total_agents, 2))
+
+        self.states = np.full(total_agents, UNAWARE, dtype=np.int8)
+        self.states[:initial_aware] = AWARE
+        self.info_time = np.full(total_agents, -1, dtype=np.int32)
+        self.info_time[:initial_aware] = 0
+
+    def step(self):
+        self.move()
+        self.update_states()
+        self.spread()
+
+    def move(self):
+        # Agents that would leave the box reverse direction and keep their old coordinate on that axis
+        new_positions = self.positions + self.velocities
+        hit = (new_positions <= self.lower) | (new_positions >= self.upper)
+        self.velocities[hit] *= -1
+        self.positions = np.where(hit, self.positions, new_positions)
+
+    def update_states(self):
+        aware = self.states == AWARE
+        self.info_time[aware] += 1
+        bored = aware & (self.info_time > self.bored_after) & (self.rng.random(self.total_agents) < self.ignore_rate)
+        self.states[bored] = BORED
+
+    def spread(self):
+        sources = np.flatnonzero(self.states == AWARE)
+        targets = np.flatnonzero(self.states == UNAWARE)
+        if len(sources) == 0 or len(targets) == 0:
+            return
+
+        contacts = contact_counts(self.positions, sources, targets, self.share_radius, method=self.contact_method)
+
+        # Each aware neighbour gets an independent chance to share
+        p_share = 1 - (1 - self.sharing_rate) ** contacts
+        informed = targets[self.rng.random(len(targets)) < p_share]
+        self.states[informed] = AWARE
+        self.info_time[informed] = 0
+
+    def counts(self):
+        values = np.bincount(self.states, minlength=len(STATE_NAMES))
+        return {name: int(value) for name, value in zip(STATE_NAMES, values)}
+
+
+def simulation_steps(engine, steps=1200, step_every=3, min_steps=20):
+    # Drives an engine (or a TrajectoryPlayer) and yields the time step after each update.
+    # Stops once nobody is aware any more, like the original scene loop.
+    for step in range(steps):
+        if step % step_every == 0:
+            engine.step()
+            yield step
+        if engine.counts()["aware"] == 0 and step > min_steps:
+            break
+
+
+INITIAL_TIME = -1
+
+
+class Trajectory:
+    # Every simulated frame: time step, positions (T, N, 2), states (T, N) and counts (T, 3).
+    # Frame 0 is the state before the first step and has time INITIAL_TIME.
+    def __init__(self, times, positions, states, counts):
+        self.times = np.asarray(times, dtype=np.int32)
+        self.positions = np.asarray(positions, dtype=np.float32)
+        self.states = np.asarray(states, dtype=np.int8)
+        self.counts = np.asarray(counts, dtype=np.int32)
+
+    def __len__(self):
+        return len(self.times)
+
+    @property
+    def total_agents(self):
+        return self.positions.shape[1]
+
+    @classmethod
+    def record(cls, engine, **kwargs):
+        times, positions, states, counts = [], [], [], []
+
+        def snapshot(time):
+            times.append(time)
+            positions.append(engine.positions.astype(np.float32))
+            states.append(engine.states.copy())
+            counts.append(np.bincount(engine.states, minlength=len(STATE_NAMES)))
+
+        snapshot(INITIAL_TIME)
+        for step in simulation_steps(engine, **kwargs):
+            snapshot(step)
+        return cls(times, positions, states, counts)
+
+    def save(self, path):
+        np.savez_compressed(path, times=self.times, positions=self.positions, states=self.states, counts=self.counts)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            return cls(data["times"], data["positions"], data["states"], data["counts"])
+
+
+class TrajectoryPlayer:
+    # Replays a Trajectory through the same step()/positions/states/counts() interface as UABEngine.
+    # It starts on the recorded initial state, like a fresh engine.
+    def __init__(self, trajectory):
+        self.trajectory = trajectory
+        self.total_agents = trajectory.total_agents
+        self.frame = 0
+
+    def step(self):
+        self.frame = min(self.frame + 1, len(self.trajectory) - 1)
+
+    def playback_steps(self):
+        # Yields the recorded time step of every frame after the initial one, so playback
+        # runs exactly as long as the recording
+        for frame in range(1, len(self.trajectory)):
+            self.frame = frame
+            yield int(self.trajectory.times[frame])
+
+    @property
+    def positions(self):
+        return self.trajectory.positions[self.frame]
+
+    @property
+    def states(self):
+        return self.trajectory.states[self.frame]
+
+    def counts(self):
+        values = self.trajectory.counts[self.frame]
+        return {name: int(value) for name, value in zip(STATE_NAMES, values)}
+
+
+def contact_counts(positions, sources, targets, radius, method="grid"):
+    # For every target, the number of sources closer than radius.
+    # "brute" checks every pair and is kept to validate the grid index against.
+    if method == "grid":
+        return grid_contact_counts(positions, sources, targets, radius)
+    if method == "brute":
+        return brute_contact_counts(positions, sources, targets, radius)
+    raise ValueError(f"Unknown contact method: {method!r}")
+
+
+def brute_contact_counts(positions, sources, targets, radius, chunk_size=2048):
+    counts = np.zeros(len(targets), dtype=np.int64)
+    source_positions = positions[sources]
+    for start in range(0, len(targets), chunk_size):
+        chunk = positions[targets[start:start + chunk_size]]
+        diff = chunk[:, None, :] - source_positions[None, :, :]
+        dist_sq = np.einsum("ijk,ijk->ij", diff, diff)
+        counts[start:start + chunk_size] = np.count_nonzero(dist_sq < radius * radius, axis=1)
+    return counts
+
+
+def grid_contact_counts(positions, sources, targets, radius):
+    # Uniform grid with cells of size radius: any pair closer than radius
+    # sits in the same or an adjacent cell, so each source only scans 3x3 cells.
+    counts = np.zeros(len(targets), dtype=np.int64)
+    if len(sources) == 0 or len(targets) == 0:
+        return counts
+
+    cells = np.floor(positions / radius).astype(np.int64)
+    cells -= cells.min(axis=0) - 1
+    stride = cells[:, 1].max() + 2
+    keys = cells[:, 0] * stride + cells[:, 1]
+
+    # Targets sorted by cell, so each cell is a contiguous slice
+    order = np.argsort(keys[targets], kind="stable")
+    sorted_targets = targets[order]
+    sorted_keys = keys[sorted_targets]
+
+    source_keys = keys[sources]
+    source_positions = positions[sources]
+    radius_sq = radius * radius
+
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            neighbour_keys = source_keys + dx * stride + dy
+            lo = np.searchsorted(sorted_keys, neighbour_keys, side="left")
+            hi = np.searchsorted(sorted_keys, neighbour_keys, side="right")
+            sizes = hi - lo
+            total = sizes.sum()
+            if total == 0:
+                continue
+
+            # Expand every (source, neighbour cell) slice into explicit candidate pairs
+            pair_sources = np.repeat(np.arange(len(sources)), sizes)
+            offsets = np.arange(total) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+            slots = np.repeat(lo, sizes) + offsets
+
+            diff = positions[sorted_targets[slots]] - source_positions[pair_sources]
+            close = np.einsum("ij,ij->i", diff, diff) < radius_sq
+            counts += np.bincount(order[slots[close]], minlength=len(targets))
+
+    return counts
+
+
+if __name__ == "__main__":
+    # Headless run: python uab_engine.py uab_trajectory.npz --agents 50000
+    parser = argparse.ArgumentParser(description="Simulate the UAB model and record its trajectory")
+    parser.add_argument("output", help="trajectory file to write (.npz)")
+    parser.add_argument("--agents", type=int, default=500)
+    parser.add_argument("--steps", type=int, default=1200)
+    parser.add_argument("--share-radius", type=float, default=0.15)
+    parser.add_argument("--sharing-rate", type=float, default=0.08)
+    parser.add_argument("--ignore-rate", type=float, default=0.05)
+    parser.add_argument("--speed", type=float, default=0.04)
+    parser.add_argument("--contact-method", choices=["grid", "brute"], default="grid")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    args = parser.parse_args()
+
+    engine = UABEngine(
+        args.agents,
+        bounds=DEFAULT_BOUNDS,
+        speed=args.speed,
+        share_radius=args.share_radius,
+        sharing_rate=args.sharing_rate,
+        ignore_rate=args.ignore_rate,
+        contact_method=args.contact_method,
+        rng=np.random.default_rng(args.seed),
+    )
+    trajectory = Trajectory.record(engine, steps=args.steps)
+    trajectory.save(args.output)
+    print(f"Recorded {len(trajectory)} frames of {trajectory.total_agents} agents to {args.output}")
@@ -0,0 +1,244 @@
+from manim import *
+
+
+class CounterLabel(VGroup):
+    # Static "Label:" text followed by an Integer (or a DecimalNumber when num_decimal_places > 0);
+    # only the digits change on set_value
+    def __init__(self, label, value=0, font_size=16, color=WHITE, buff=0.1, num_decimal_places=0, **kwargs):
+        super().__init__(**kwargs)
+        self.label = Text(f"{label}:", font_size=font_size, color=color)
+        if num_decimal_places:
+            self.counter = DecimalNumber(value, num_decimal_places=num_decimal_places, font_size=font_size * 1.2, color=color)
+        else:
+            self.counter = Integer(value, font_size=font_size * 1.2, color=color)
+        self.counter.next_to(self.label, RIGHT, buff=buff)
+        self.counter.align_to(self.label, DOWN)
+        self.add(self.label, self.counter)
+
+    def set_value(self, value):
+        if value != self.counter.get_value():
+            self.counter.set_value(value)
+        return self
+
+
+class StatsPanel(VGroup):
+    # entries: {key: (label, color)}; the layout reserves room for max_value digits
+    # so counters can change width without re-arranging the panel
+    def __init__(self, entries, max_value=0, font_size=16, buff=0.5, **kwargs):
+        super().__init__(**kwargs)
+        self.counters = {}
+        for key, (label, color) in entries.items():
+            counter = CounterLabel(label, max_value, font_size=font_size, color=color)
+            self.counters[key] = counter
+            self.add(counter)
+        self.arrange(RIGHT, buff=buff)
+
+    def set_counts(self, counts):
+        for key, value in counts.items():
+            if key in self.counters:
+                self.counters[key].set_value(value)
+        return self
+
+
+class DotCloud(VGroup):
+    # Many same-sized round dots as one VMobject per colour: every dot is a circle subpath of its
+    # colour's layer, so N dots cost one draw call per colour instead of N Dots.
+    # Dot i is circle block row_of[i] of layers[layer_of[i]].
+    def __init__(self, positions, radius=0.05, color=WHITE, **kwargs):
+        super().__init__(**kwargs)
+        self.dot_radius = radius
+        positions = np.atleast_2d(np.asarray(positions, dtype=float))
+        centers = np.zeros((len(positions), 3))
+        centers[:, :positions.shape[1]] = positions
+
+        circle = Circle(radius=radius).points
+        self.template = circle - circle.mean(axis=0)
+        self.layers = []
+        self.layer_colors = []
+        self.members = []
+        self.layer_of = np.zeros(len(centers), dtype=int)
+        self.row_of = np.arange(len(centers))
+        layer = self.get_layer(color)
+        self.set_layer(layer, self.template[None, :, :] + centers[:, None, :], np.arange(len(centers)))
+
+    def get_layer(self, color):
+        key = rgb_to_hex(color_to_rgb(color))
+        if key not in self.layer_colors:
+            self.layer_colors.append(key)
+            self.layers.append(VMobject().set_fill(color, opacity=1).set_stroke(width=0))
+            self.members.append(np.zeros(0, dtype=int))
+            self.add(self.layers[-1])
+        return self.layer_colors.index(key)
+
+    def blocks(self, layer):
+        # (dots, points per circle, 3) view of one layer's points
+        return self.layers[layer].points.reshape(-1, len(self.template), 3)
+
+    def set_layer(self, layer, blocks, members):
+        self.layers[layer].set_points(blocks.reshape(-1, 3))
+        self.members[layer] = members
+        self.layer_of[members] = layer
+        self.row_of[members] = np.arange(len(members))
+
+    def set_positions(self, positions, indices=None):
+        # Shifts each circle so its centre lands on the new position; the circles keep whatever
+        # size scaling the cloud has had
+        dots = np.arange(len(self.layer_of))
+        if indices is not None:
+            dots = dots[indices]
+        positions = np.atleast_2d(np.asarray(positions, dtype=float))
+        dim = positions.shape[1]
+        for layer in np.unique(self.layer_of[dots]):
+            in_layer = self.layer_of[dots] == layer
+            rows = self.row_of[dots[in_layer]]
+            blocks = self.blocks(layer)
+            offsets = positions[in_layer] - blocks[rows, :, :dim].mean(axis=1)
+            blocks[rows, :, :dim] += offsets[:, None, :]
+            self.layers[layer].points = blocks.reshape(-1, 3)
+        return self
+
+    def set_dot_colors(self, indices, color):
+        # Moves the chosen circles into the layer of the new colour
+        target = self.get_layer(color)
+        dots = np.arange(len(self.layer_of))[indices]
+        dots = dots[self.layer_of[dots] != target]
+        if len(dots) == 0:
+            return self
+
+        moved_blocks = [self.blocks(target)]
+        moved_members = [self.members[target]]
+        for layer in np.unique(self.layer_of[dots]):
+            leaving = dots[self.layer_of[dots] == layer]
+            blocks = self.blocks(layer)
+            keep = np.ones(len(blocks), dtype=bool)
+            keep[self.row_of[leaving]] = False
+            moved_blocks.append(blocks[self.row_of[leaving]])
+            moved_members.append(leaving)
+            self.set_layer(layer, blocks[keep], self.members[layer][keep])
+        self.set_layer(target, np.concatenate(moved_blocks), np.concatenate(moved_members))
+        return self
+
+
+def smooth_array(t, inflection=10.0):
+    # manim's smooth rate function, evaluated on a whole array at once
+    error = sigmoid(-inflection / 2)
+    return np.clip((sigmoid(inflection * (np.asarray(t) - 0.5)) - error) / (1 - 2 * error), 0, 1)
+
+
+class RevealDots(Animation):
+    # LaggedStart of one FadeIn(scale=0.5) per dot of a DotCloud. Dots that are still fading are
+    # drawn in a few opacity buckets per colour, so a frame costs a handful of draw calls.
+    def __init__(self, cloud, lag_ratio=0.05, buckets=8, rate_func=linear, **kwargs):
+        self.reveal_lag_ratio = lag_ratio
+        self.buckets = buckets
+        super().__init__(cloud, rate_func=rate_func, introducer=True, **kwargs)
+
+    def begin(self):
+        cloud = self.mobject
+        self.full_blocks = [cloud.blocks(layer).copy() for layer in range(len(cloud.layers))]
+        self.fading = []
+        for layer in cloud.layers:
+            opacity = layer.get_fill_opacity()
+            self.fading.append([
+                layer.copy().set_points(np.zeros((0, 3))).set_fill(opacity=opacity * (k + 0.5) / self.buckets)
+                for k in range(self.buckets)
+            ])
+        cloud.add(*[bucket for buckets in self.fading for bucket in buckets])
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        cloud = self.mobject
+        n = len(cloud.layer_of)
+        total = (n - 1) * self.reveal_lag_ratio + 1
+        local = np.clip(alpha * total - np.arange(n) * self.reveal_lag_ratio, 0, 1)
+        eased = smooth_array(local)
+
+        for layer, members, full, buckets in zip(cloud.layers, cloud.members, self.full_blocks, self.fading):
+            done = local[members] >= 1
+            fading = (local[members] > 0) & ~done
+            progress = eased[members]
+            layer.set_points(full[done].reshape(-1, 3))
+
+            # Every fading dot's size and opacity bucket in one pass; the buckets are then
+            # filled from a single sort instead of one mask per bucket
+            centers = full.mean(axis=1, keepdims=True)
+            scaled = centers + (full - centers) * (0.5 + 0.5 * progress)[:, None, None]
+            rows = np.flatnonzero(fading)
+            bucket_of = np.minimum((progress[rows] * self.buckets).astype(int), self.buckets - 1)
+            order = np.argsort(bucket_of, kind="stable")
+            bounds = np.searchsorted(bucket_of[order], np.arange(self.buckets + 1))
+            for k, bucket in enumerate(buckets):
+                bucket.set_points(scaled[rows[order[bounds[k]:bounds[k + 1]]]].reshape(-1, 3))
+
+    def finish(self):
+        super().finish()
+        cloud = self.mobject
+        for layer, full in zip(cloud.layers, self.full_blocks):
+            layer.set_points(full.reshape(-1, 3))
+        cloud.remove(*[bucket for buckets in self.fading for bucket in buckets])
+
+
+def resize_brace(brace, start, end, axis=0, hook=0.3):
+    # Makes a straight Brace span start..end along axis (0 = x, 1 = y) in place, without building
+    # a new one: the tip and the two end hooks keep their shape and only the straight runs between
+    # them stretch. Once the span is too short for that, the brace is squeezed uniformly.
+    points = brace.points
+    low, high = points[:, axis].min(), points[:, axis].max()
+    old_center, old_half = (low + high) / 2, (high - low) / 2
+    new_center, new_half = (start + end) / 2, abs(end - start) / 2
+
+    offset = points[:, axis] - old_center
+    distance = np.abs(offset)
+    keep = min(hook, old_half / 3)
+    if new_half > 2 * keep and old_half > 2 * keep:
+        middle = keep + (distance - keep) * (new_half - 2 * keep) / (old_half - 2 * keep)
+        distance = np.where(
+            distance <= keep, distance,
+            np.where(distance >= old_half - keep, distance + new_half - old_half, middle)
+        )
+    else:
+        distance = distance * new_half / max(old_half, 1e-9)
+    points[:, axis] = new_center + np.sign(offset) * distance
+    return brace
+
+
+class TrackedFunction:
+    # function(tracker value), evaluated at most once per tracker value and shared by every updater
+    # that reads it; while the tracker is still, value() is a plain attribute read
+    def __init__(self, tracker, function):
+        self.tracker = tracker
+        self.function = function
+        self.last_input = None
+        self.last_value = None
+
+    def input(self):
+        return self.tracker.get_value()
+
+    def value(self):
+        x = self.tracker.get_value()
+        if x != self.last_input:
+            self.last_input = x
+            self.last_value = self.function(x)
+        return self.last_value
+
+
+class TrackedDot(Dot):
+    # One Dot that follows (x, f(x)) of a TrackedFunction on axes, moved in place every frame
+    # instead of being rebuilt the way always_redraw would
+    def __init__(self, axes, tracked, **kwargs):
+        self.axes = axes
+        self.tracked = tracked
+        super().__init__(point=axes.c2p(tracked.input(), tracked.value()), **kwargs)
+        self.add_updater(lambda m: m.follow())
+
+    def follow(self):
+        self.move_to(self.axes.c2p(self.tracked.input(), self.tracked.value()))
+        return self
+
+
+def follow_value(decimal, tracked, anchor, direction):
+    # DecimalNumber updater: re-typeset digits only when the shared value changed, then re-position
+    value = tracked.value()
+    if value != decimal.get_value():
+        decimal.set_value(value)
+    return decimal.next_to(anchor, direction)